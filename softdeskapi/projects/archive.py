@@ -0,0 +1,88 @@
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Case, DateTimeField, Q, Value, When
+from django.utils import timezone
+
+from .counts import comment_count_key, invalidate_counts, issue_count_key
+from .models import ArchivedComment, ArchivedIssue, Comment, Issue, Project
+
+# champs recopiés à l'identique entre tables actives et tables d'archive
+ISSUE_FIELDS = [
+    "id",
+    "project_id",
+    "author_id",
+    "name",
+    "description",
+    "priority",
+    "tag",
+    "status",
+    "attribution_id",
+    "created_time",
+    "finished_time",
+]
+COMMENT_FIELDS = ["id", "issue_id", "author_id", "description", "uuid", "created_time"]
+
+
+def archive_finished_issues(older_than_days, batch_size=500):
+    """Déplace vers les tables d'archive les issues terminées depuis plus de `older_than_days` jours,
+    avec leurs commentaires, par lots de `batch_size` issues (une transaction courte par lot).
+    Une issue terminée sans finished_time (passée au statut "finished" avant l'ajout de cette colonne)
+    est considérée comme terminée à sa date de création. Renvoie le nombre d'issues archivées.
+    """
+    cutoff = timezone.now() - timedelta(days=older_than_days)
+    finished_before_cutoff = Q(finished_time__lt=cutoff) | Q(finished_time__isnull=True, created_time__lt=cutoff)
+    archived = 0
+    while True:
+        with transaction.atomic():
+            issues = list(
+                Issue.objects.filter(finished_before_cutoff, status="finished")
+                .order_by("finished_time", "id")
+                .values(*ISSUE_FIELDS)[:batch_size]
+            )
+            if not issues:
+                return archived
+            issue_ids = [issue["id"] for issue in issues]
+            comments = list(Comment.objects.filter(issue_id__in=issue_ids).values(*COMMENT_FIELDS))
+
+            ArchivedIssue.objects.bulk_create([ArchivedIssue(**issue) for issue in issues])
+            ArchivedComment.objects.bulk_create([ArchivedComment(**comment) for comment in comments])
+            Comment.objects.filter(issue_id__in=issue_ids).delete()
+            Issue.objects.filter(id__in=issue_ids).delete()
+            # la dernière activité ne tient compte que des issues et commentaires actifs
+            Project.objects.filter(id__in={issue["project_id"] for issue in issues}).refresh_last_activity()
+        # les nombres d'issues et de commentaires en cache des projets concernés ne sont plus à jour
+        invalidate_counts(
+            [issue_count_key(issue["project_id"]) for issue in issues]
+            + [comment_count_key(issue["project_id"], issue["id"]) for issue in issues]
+        )
+        archived += len(issues)
+
+
+def restore_issue(archived_issue, status="to-do"):
+    """Remet une issue archivée (et ses commentaires) dans les tables actives avec le statut `status`.
+    L'issue et ses commentaires retrouvent leurs id d'origine. Renvoie l'issue restaurée.
+    """
+    with transaction.atomic():
+        comments = list(archived_issue.comments.values(*COMMENT_FIELDS))
+        issue = Issue(**{field: getattr(archived_issue, field) for field in ISSUE_FIELDS})
+        issue.status = status
+        issue.save(force_insert=True)
+        Comment.objects.bulk_create([Comment(**comment) for comment in comments])
+
+        # auto_now_add écrase created_time à l'insertion : on rétablit les dates d'origine
+        Issue.objects.filter(id=issue.id).update(created_time=archived_issue.created_time)
+        issue.created_time = archived_issue.created_time
+        if comments:
+            Comment.objects.filter(id__in=[comment["id"] for comment in comments]).update(
+                created_time=Case(
+                    *[When(id=comment["id"], then=Value(comment["created_time"])) for comment in comments],
+                    output_field=DateTimeField(),
+                )
+            )
+
+        archived_issue.delete()
+        # Issue.save a daté l'activité de la restauration : recalcul avec les dates d'origine
+        Project.objects.filter(id=issue.project_id).refresh_last_activity()
+    invalidate_counts([issue_count_key(issue.project_id), comment_count_key(issue.project_id, issue.id)])
+    return issue
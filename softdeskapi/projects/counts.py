@@ -0,0 +1,33 @@
+from django.core.cache import cache
+
+# Nombres d'éléments des listes paginées, conservés dans le cache par défaut : partagé entre les workers avec
+# settings_production (fichiers), propre à chaque processus avec settings.py (mémoire locale).
+# cache.incr n'est pas atomique entre processus : deux mises à jour simultanées peuvent s'écraser.
+
+# durée de vie (en secondes) d'un nombre d'éléments en cache : borne l'écart possible avec le nombre réel
+COUNT_CACHE_TIMEOUT = 300
+
+
+def issue_count_key(project_id):
+    """Clé de cache du nombre d'issues (actives) d'un projet."""
+    return f"projects:{project_id}:issues:count"
+
+
+def comment_count_key(project_id, issue_id):
+    """Clé de cache du nombre de commentaires d'une issue d'un projet."""
+    return f"projects:{project_id}:issues:{issue_id}:comments:count"
+
+
+def adjust_count(key, delta):
+    """Tient à jour un nombre en cache après création (+1) ou suppression (-1) d'un élément.
+    Sans valeur en cache, il n'y a rien à tenir à jour : elle sera recalculée au prochain affichage.
+    """
+    try:
+        cache.incr(key, delta)
+    except ValueError:
+        pass
+
+
+def invalidate_counts(keys):
+    """Supprime des nombres en cache après une opération par lot (archivage, restauration...)."""
+    cache.delete_many(list(keys))
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+from projects.archive import archive_finished_issues
+
+
+class Command(BaseCommand):
+    """Archive les issues terminées depuis plus de N jours (avec leurs commentaires), par lots bornés.
+    Sans finished_time (issues terminées avant l'ajout de la colonne), la date de création fait foi.
+    """
+
+    help = (
+        "Déplace les issues terminées depuis plus de --days jours et leurs commentaires vers les tables d'archive. "
+        "Les issues terminées avant l'ajout de finished_time (valeur NULL) sont datées de leur création."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=90, help="ancienneté minimale du statut finished (jours)")
+        parser.add_argument("--batch-size", type=int, default=500, help="nombre d'issues par transaction")
+
+    def handle(self, *args, **options):
+        archived = archive_finished_issues(options["days"], batch_size=options["batch_size"])
+        self.stdout.write(f"{archived} issue(s) archivée(s)")
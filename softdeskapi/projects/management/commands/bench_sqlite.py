@@ -0,0 +1,122 @@
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+from django.core.management.utils import get_random_secret_key
+
+
+class Command(BaseCommand):
+    """Mesure le débit lectures/écritures concurrentes sur SQLite,
+    avec la configuration par défaut puis avec le profil `settings_production`.
+    """
+
+    help = "Compare le débit lectures/écritures de SQLite avec et sans le profil de production"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--threads", type=int, default=8, help="nombre de threads concurrents")
+        parser.add_argument("--duration", type=float, default=5.0, help="durée de chaque mesure (secondes)")
+        parser.add_argument("--write-ratio", type=float, default=0.2, help="proportion d'écritures (0 à 1)")
+        parser.add_argument("--rows", type=int, default=20000, help="nombre d'issues pré-remplies")
+
+    def handle(self, *args, **options):
+        # seules les constantes SQLite du profil sont utilisées : une clé jetable suffit pour l'importer
+        os.environ.setdefault("DJANGO_SECRET_KEY", get_random_secret_key())
+        from softdeskapi import settings_production
+
+        self.production = settings_production
+        for profile in ("default", "production"):
+            with tempfile.TemporaryDirectory() as tmp:
+                path = Path(tmp) / "bench.sqlite3"
+                self.seed(path, options["rows"])
+                result = self.run_profile(profile, path, options)
+            self.stdout.write(
+                f"{profile:<11} lectures/s={result['reads'] / options['duration']:>9.0f}  "
+                f"écritures/s={result['writes'] / options['duration']:>8.0f}  "
+                f"erreurs 'locked'={result['locked']}"
+            )
+
+    def seed(self, path, rows):
+        """Crée une table proche de projects_issue et la pré-remplit."""
+        conn = sqlite3.connect(path)
+        conn.execute(
+            "CREATE TABLE issue (id INTEGER PRIMARY KEY, project_id INTEGER, name TEXT, status TEXT, created_time TEXT)"
+        )
+        conn.execute("CREATE INDEX issue_project ON issue (project_id)")
+        conn.executemany(
+            "INSERT INTO issue (project_id, name, status, created_time) VALUES (?, ?, 'to-do', datetime('now'))",
+            ((i % 100, f"issue {i}") for i in range(rows)),
+        )
+        conn.commit()
+        conn.close()
+
+    def connect(self, profile, path, readonly=False):
+        """Ouvre une connexion comme le ferait Django pour le profil donné."""
+        if profile == "default":
+            return sqlite3.connect(path, timeout=5, check_same_thread=False)
+        uri = f"file:{path}?mode=ro" if readonly else f"file:{path}"
+        conn = sqlite3.connect(
+            uri, uri=True, timeout=self.production.SQLITE_BUSY_TIMEOUT, isolation_level="IMMEDIATE"
+        )
+        pragmas = self.production.SQLITE_REPLICA_PRAGMAS if readonly else self.production.SQLITE_PRIMARY_PRAGMAS
+        for pragma in pragmas:
+            conn.execute(pragma)
+        return conn
+
+    def run_profile(self, profile, path, options):
+        result = {"reads": 0, "writes": 0, "locked": 0}
+        lock = threading.Lock()
+        deadline = time.perf_counter() + options["duration"]
+
+        def worker():
+            counts = {"reads": 0, "writes": 0, "locked": 0}
+            persistent = profile == "production"
+            # Profil production : connexions persistantes (CONN_MAX_AGE), une en écriture, une en lecture seule
+            if persistent:
+                primary = self.connect(profile, path)
+                replica = self.connect(profile, path, readonly=True)
+            while time.perf_counter() < deadline:
+                write = random.random() < options["write_ratio"]
+                # Profil par défaut : CONN_MAX_AGE=0, une nouvelle connexion par requête
+                if not persistent:
+                    conn = self.connect(profile, path)
+                else:
+                    conn = primary if write else replica
+                try:
+                    if write:
+                        conn.execute(
+                            "INSERT INTO issue (project_id, name, status, created_time) "
+                            "VALUES (?, 'bench', 'to-do', datetime('now'))",
+                            (random.randrange(100),),
+                        )
+                        conn.commit()
+                        counts["writes"] += 1
+                    else:
+                        conn.execute(
+                            "SELECT id, name, status FROM issue WHERE project_id = ? ORDER BY id DESC LIMIT 10",
+                            (random.randrange(100),),
+                        ).fetchall()
+                        counts["reads"] += 1
+                except sqlite3.OperationalError:
+                    conn.rollback()
+                    counts["locked"] += 1
+                finally:
+                    if not persistent:
+                        conn.close()
+            if persistent:
+                primary.close()
+                replica.close()
+            with lock:
+                for key, value in counts.items():
+                    result[key] += value
+
+        threads = [threading.Thread(target=worker) for _ in range(options["threads"])]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return result
@@ -0,0 +1,112 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.core.management.utils import get_random_secret_key
+
+# Script exécuté dans un interpréteur neuf : durée d'import du point d'entrée, durée de la première requête
+# puis durée moyenne des requêtes suivantes (en HTTPS : le profil de production redirige HTTP vers HTTPS)
+CHILD_SCRIPT = """
+import asyncio, importlib, io, json, sys, time
+
+entry, path, repeat = sys.argv[1], sys.argv[2], int(sys.argv[3])
+start = time.perf_counter()
+application = importlib.import_module(entry).application
+imported = time.perf_counter()
+
+def call():
+    environ = {
+        "REQUEST_METHOD": "GET", "PATH_INFO": path, "QUERY_STRING": "", "SERVER_NAME": "localhost",
+        "SERVER_PORT": "80", "HTTP_HOST": "localhost", "wsgi.url_scheme": "https", "wsgi.input": io.BytesIO(),
+        "wsgi.errors": sys.stderr, "wsgi.version": (1, 0), "wsgi.multithread": False,
+        "wsgi.multiprocess": True, "wsgi.run_once": False,
+    }
+    response = application(environ, lambda status, headers: None)
+    b"".join(response)
+    response.close()
+
+
+async def request():
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET", "scheme": "https",
+        "path": path, "raw_path": path.encode(), "query_string": b"", "root_path": "",
+        "headers": [(b"host", b"localhost")], "client": ("127.0.0.1", 0), "server": ("localhost", 80),
+    }
+    sent = False
+
+    async def receive():
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.Event().wait()
+
+    async def send(message):
+        pass
+
+    await application(scope, receive, send)
+
+
+if entry.split(".")[-1].startswith("wsgi"):
+    run = call
+else:
+    def run():
+        asyncio.run(request())
+
+run()
+answered = time.perf_counter()
+# requêtes suivantes : coût par requête une fois le worker chaud (middlewares, rendu)
+for _ in range(repeat):
+    run()
+steady = (time.perf_counter() - answered) / max(repeat, 1)
+print(json.dumps({"import": imported - start, "first_request": answered - imported, "steady": steady}))
+"""
+
+PROFILES = [
+    ("complet", "softdeskapi.wsgi", "softdeskapi.asgi"),
+    ("api seule", "softdeskapi.wsgi_api", "softdeskapi.asgi_api"),
+]
+
+
+class Command(BaseCommand):
+    """Mesure le démarrage à froid d'un worker (import de wsgi.py/asgi.py puis première requête)
+    pour le profil complet et pour le profil "API seule", chaque mesure dans un interpréteur neuf.
+    """
+
+    help = "Compare le temps d'import et la latence de la première requête des profils complet et API seule"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--runs", type=int, default=10, help="nombre de démarrages par point d'entrée")
+        parser.add_argument("--path", default="/projects/", help="URL de la première requête")
+        parser.add_argument("--requests", type=int, default=200, help="requêtes mesurées une fois le worker chaud")
+
+    def handle(self, *args, **options):
+        env = {key: value for key, value in os.environ.items() if key != "DJANGO_SETTINGS_MODULE"}
+        # variables exigées par le profil de production, si elles ne sont pas déjà définies
+        env.setdefault("DJANGO_SECRET_KEY", get_random_secret_key())
+        env.setdefault("DJANGO_ALLOWED_HOSTS", "localhost")
+        for name, *entries in PROFILES:
+            for entry in entries:
+                imports, requests, steady = [], [], []
+                for _ in range(options["runs"]):
+                    output = subprocess.run(
+                        [sys.executable, "-c", CHILD_SCRIPT, entry, options["path"], str(options["requests"])],
+                        cwd=settings.BASE_DIR,
+                        env=env,
+                        capture_output=True,
+                        text=True,
+                        check=True,
+                    ).stdout
+                    timings = json.loads(output.strip().splitlines()[-1])
+                    imports.append(timings["import"])
+                    requests.append(timings["first_request"])
+                    steady.append(timings["steady"])
+                self.stdout.write(
+                    f"{name:<10} {entry:<22} import={statistics.median(imports) * 1000:7.1f} ms  "
+                    f"première requête={statistics.median(requests) * 1000:7.1f} ms  "
+                    f"requêtes suivantes={statistics.median(steady) * 1000:6.3f} ms"
+                )
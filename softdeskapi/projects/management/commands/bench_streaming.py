@@ -0,0 +1,88 @@
+import asyncio
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import AsyncClient
+from django.test.utils import setup_test_environment, teardown_test_environment
+from projects.models import Contributor, Issue, Project
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+from users.models import User
+
+
+class Command(BaseCommand):
+    """Mesure le pic mémoire d'une requête de liste d'issues selon la taille de page,
+    avec le rendu JSON habituel de DRF puis avec la réponse en flux (StreamingJSONRenderer), servie sous WSGI
+    et sous ASGI. Travaille sur une base de test temporaire.
+    """
+
+    help = "Compare le pic mémoire par requête du rendu JSON complet et du rendu en flux selon la taille de page"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--issues", type=int, default=5000, help="nombre d'issues du projet")
+        parser.add_argument("--page-sizes", type=int, nargs="+", default=[10, 100, 500, 1000])
+
+    def handle(self, *args, **options):
+        # autorise l'hôte "testserver" du client de test, comme le lanceur de tests
+        setup_test_environment()
+        test_db = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            user = User.objects.create_user(email="bench@softdesk.fr", password="bench", age=30)
+            project = Project.objects.create(author=user, name="bench", description="bench")
+            Contributor.objects.create(user=user, project=project, author=True)
+            Issue.objects.bulk_create(
+                [
+                    Issue(project=project, author=user, attribution=user, name=f"issue {i}", description="x" * 500)
+                    for i in range(options["issues"])
+                ],
+                batch_size=1000,
+            )
+            client = APIClient()
+            client.force_authenticate(user)
+            async_client = AsyncClient()
+            async_headers = {"Authorization": f"Bearer {AccessToken.for_user(user)}"}
+
+            for page_size in options["page_sizes"]:
+                url = f"/projects/{project.id}/issues/?page_size={page_size}"
+                # "indent=0" : rendu en une fois par JSONRenderer (pas de flux) ; le JSON n'est plus compact
+                # (un retour à la ligne par valeur), donc un peu plus volumineux que la réponse en flux
+                buffered = self.measure(client, url, HTTP_ACCEPT="application/json; indent=0")
+                streamed = self.measure(client, url)
+                streamed_asgi = asyncio.run(self.measure_async(async_client, url, async_headers))
+                self.stdout.write(
+                    f"page_size={page_size:>5}  complet: pic={buffered[0] / 1024:8.0f} Kio {buffered[1] * 1000:7.1f} ms"
+                    f"  |  flux: pic={streamed[0] / 1024:8.0f} Kio {streamed[1] * 1000:7.1f} ms"
+                    f"  |  flux ASGI: pic={streamed_asgi[0] / 1024:8.0f} Kio {streamed_asgi[1] * 1000:7.1f} ms"
+                )
+        finally:
+            connection.creation.destroy_test_db(test_db, verbosity=0)
+            teardown_test_environment()
+
+    def measure(self, client, url, **headers):
+        """Renvoie (pic mémoire en octets, durée en secondes) d'une requête dont la réponse est lue puis jetée."""
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+        start = time.perf_counter()
+        response = client.get(url, **headers)
+        chunks = response.streaming_content if response.streaming else [response.content]
+        for _ in chunks:
+            pass
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return peak, elapsed
+
+    async def measure_async(self, client, url, headers):
+        """Comme `measure`, avec le client de test ASGI : la réponse en flux est lue morceau par morceau."""
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+        start = time.perf_counter()
+        response = await client.get(url, headers=headers)
+        async for _ in response.streaming_content:
+            pass
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return peak, elapsed
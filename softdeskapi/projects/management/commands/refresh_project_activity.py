@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+from projects.models import Project
+
+
+class Command(BaseCommand):
+    """Recalcule la date de dernière activité de tous les projets, par lots bornés.
+    À lancer une fois après l'ajout de la colonne Project.last_activity (projets existants).
+    """
+
+    help = "Recalcule Project.last_activity à partir des dates de création des issues et commentaires actifs"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500, help="nombre de projets par requête")
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        last_id = 0
+        updated = 0
+        while True:
+            ids = list(Project.objects.filter(id__gt=last_id).order_by("id").values_list("id", flat=True)[:batch_size])
+            if not ids:
+                break
+            updated += Project.objects.filter(id__in=ids).refresh_last_activity()
+            last_id = ids[-1]
+        self.stdout.write(f"{updated} projet(s) mis à jour")
@@ -2,6 +2,68 @@ import uuid
 
 from django.conf import settings
 from django.db import models
+from django.db.models import Count, IntegerField, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+
+
+class ProjectQuerySet(models.QuerySet):
+    """QuerySet des projets avec résumé d'activité calculé en sous-requêtes dans la même requête SQL."""
+
+    def with_activity_summary(self):
+        """Annote chaque projet avec open_issues_count et contributors_count
+        (last_activity est une colonne de Project, tenue à jour à l'écriture).
+        """
+        open_issues = (
+            Issue.objects.filter(project=OuterRef("pk"))
+            .exclude(status="finished")
+            .order_by()
+            .values("project")
+            .annotate(count=Count("pk"))
+            .values("count")
+        )
+        contributors = (
+            Contributor.objects.filter(project=OuterRef("pk"))
+            .order_by()
+            .values("project")
+            .annotate(count=Count("pk"))
+            .values("count")
+        )
+        return self.annotate(
+            open_issues_count=Coalesce(Subquery(open_issues, output_field=IntegerField()), 0),
+            contributors_count=Coalesce(Subquery(contributors, output_field=IntegerField()), 0),
+        )
+
+    def touch_activity(self, when):
+        """Avance last_activity à `when` pour les projets du queryset (création d'une issue ou d'un commentaire)."""
+        return self.filter(last_activity__lt=when).update(last_activity=when)
+
+    def refresh_last_activity(self):
+        """Recalcule last_activity (date la plus récente entre la création du projet, de ses issues et de leurs
+        commentaires) pour les projets du queryset, après un archivage ou une restauration d'issues.
+        """
+        # sous-requêtes servies par les index (project, created_time) et (issue, created_time)
+        last_issue = (
+            Issue.objects.filter(project=OuterRef("pk"))
+            .order_by()
+            .values("project")
+            .annotate(last=Max("created_time"))
+            .values("last")
+        )
+        last_comment = (
+            Comment.objects.filter(issue__project=OuterRef("pk"))
+            .order_by()
+            .values("issue__project")
+            .annotate(last=Max("created_time"))
+            .values("last")
+        )
+        return self.update(
+            last_activity=Greatest(
+                "created_time",
+                Coalesce(Subquery(last_issue), "created_time"),
+                Coalesce(Subquery(last_comment), "created_time"),
+            )
+        )
 
 
 class Project(models.Model):
@@ -22,6 +84,17 @@ class Project(models.Model):
     description = models.TextField(max_length=4095, verbose_name="description du projet")
     type = models.CharField(max_length=10, choices=TYPE_CHOICES, default="back-end")
     created_time = models.DateTimeField(auto_now_add=True, verbose_name="Date de création")
+    # date de la dernière création d'issue ou de commentaire (tenue à jour par Issue.save et Comment.save,
+    # recalculée à l'archivage et à la restauration ; une suppression ne la fait pas reculer)
+    last_activity = models.DateTimeField(default=timezone.now, verbose_name="Date de dernière activité")
+
+    objects = ProjectQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # tri de la liste par dernière activité (?ordering=±last_activity), id départageant les égalités
+            models.Index(fields=["last_activity", "id"], name="project_last_activity_idx"),
+        ]
 
 
 class Contributor(models.Model):
@@ -82,6 +155,30 @@ class Issue(models.Model):
     )
     attribution = models.ForeignKey(to=settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     created_time = models.DateTimeField(auto_now_add=True, verbose_name="Date de création de la tâche")
+    finished_time = models.DateTimeField(null=True, blank=True, verbose_name="Date de passage au statut finished")
+
+    class Meta:
+        indexes = [
+            # dernière activité d'un projet (Max(created_time) par projet) et tri des issues d'un projet
+            models.Index(fields=["project", "created_time"], name="issue_project_created_idx"),
+            # sélection des issues terminées à archiver
+            models.Index(fields=["status", "finished_time"], name="issue_status_finished_idx"),
+            # fil "assignées à moi" : parcours dans l'ordre de created_time pour une attribution donnée,
+            # status lu dans l'index (pas de tri en mémoire, avec ou sans filtre sur status)
+            models.Index(fields=["attribution", "created_time", "status"], name="issue_assigned_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        """Enregistre l'issue en tenant à jour la date de passage au statut "finished" (utilisée pour l'archivage)."""
+        if self.status == "finished":
+            if self.finished_time is None:
+                self.finished_time = timezone.now()
+        else:
+            self.finished_time = None
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+        if adding:
+            Project.objects.filter(pk=self.project_id).touch_activity(self.created_time)
 
 
 class Comment(models.Model):
@@ -101,3 +198,68 @@ class Comment(models.Model):
         verbose_name="identifiant numérique du commentaire",
     )
     created_time = models.DateTimeField(auto_now_add=True, verbose_name="Date de création du commentaire")
+
+    class Meta:
+        indexes = [
+            # dernière activité d'une issue (Max(created_time) par issue) et tri des commentaires d'une issue
+            models.Index(fields=["issue", "created_time"], name="comment_issue_created_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        """Enregistre le commentaire et, à sa création, avance la dernière activité du projet."""
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+        if adding:
+            Project.objects.filter(issue=self.issue_id).touch_activity(self.created_time)
+
+
+class ArchivedIssue(models.Model):
+    """modèle pour représenter une issue terminée déplacée hors de la table des issues actives
+    (mêmes champs et même id que l'issue d'origine, plus archived_time)
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    project = models.ForeignKey(to=Project, on_delete=models.CASCADE, related_name="archived_issues")
+    author = models.ForeignKey(
+        to=settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="archived_issue_author",
+    )
+    name = models.CharField(max_length=127)
+    description = models.TextField(max_length=1023)
+    priority = models.CharField(max_length=6, choices=Issue.PRIORITY_CHOICES)
+    tag = models.CharField(max_length=8, choices=Issue.TAG_CHOICES)
+    status = models.CharField(max_length=12, choices=Issue.STATUS_CHOICES)
+    attribution = models.ForeignKey(
+        to=settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="archived_issue_attribution",
+    )
+    created_time = models.DateTimeField()
+    finished_time = models.DateTimeField(null=True)
+    archived_time = models.DateTimeField(auto_now_add=True, verbose_name="Date d'archivage")
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["project", "created_time"], name="archivedissue_project_idx"),
+        ]
+
+
+class ArchivedComment(models.Model):
+    """modèle pour représenter un commentaire d'une issue archivée (mêmes champs et même id que l'original)"""
+
+    id = models.BigIntegerField(primary_key=True)
+    issue = models.ForeignKey(to=ArchivedIssue, on_delete=models.CASCADE, related_name="comments")
+    author = models.ForeignKey(
+        to=settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="archived_comment_author",
+    )
+    description = models.TextField(max_length=4095)
+    uuid = models.UUIDField(unique=True)
+    created_time = models.DateTimeField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["issue", "created_time"], name="archivedcomment_issue_idx"),
+        ]
@@ -1,4 +1,5 @@
 from rest_framework.permissions import BasePermission
+from users.tokens import MEMBERSHIP_VERSION_CLAIM, PROJECTS_CLAIM
 
 from .models import Contributor
 
@@ -21,14 +22,28 @@ class IsContributor(BasePermission):
     """Permission qui vérifie que l'utilisateur est contributeur d'un projet pour y accéder."""
 
     def has_permission(self, request, view):
-        # Pour les vues de liste (GET /projects/), le `get_queryset` de la vue gère le filtrage des projets visibles
-        if view.action == "list":
+        project_id = view.kwargs.get("project")
+        # Pour la liste des projets (GET /projects/), le `get_queryset` de la vue gère le filtrage des projets visibles
+        if view.action == "list" and not project_id:
             return True
 
-        # Pour les vues de détail (avec project_id), vérifier ici que l'utilisateur est contributeur du projet
-        project_id = view.kwargs.get("project")
+        # Pour les vues imbriquées (avec project_id), vérifier ici que l'utilisateur est contributeur du projet
         if project_id:
+            if self.is_member_from_token(request, int(project_id)):
+                return True
             return Contributor.objects.filter(project_id=project_id, user=request.user).exists()
 
         # Pour d'autres types de requêtes, laisser les autres permissions décider
         return True
+
+    def is_member_from_token(self, request, project_id):
+        """Vérifie l'appartenance au projet à partir des claims du token d'accès, sans requête.
+        Les claims ne sont fiables que si la version d'appartenance du token est celle de l'utilisateur
+        (elle change quand il est retiré d'un projet). Renvoie False si la base doit être consultée.
+        """
+        token = request.auth
+        if token is None or PROJECTS_CLAIM not in token:
+            return False
+        if token.get(MEMBERSHIP_VERSION_CLAIM) != request.user.membership_version:
+            return False
+        return project_id in token[PROJECTS_CLAIM]
@@ -1,7 +1,7 @@
 from django.shortcuts import get_object_or_404
 from rest_framework import serializers
 
-from .models import Comment, Contributor, Issue, Project
+from .models import ArchivedComment, ArchivedIssue, Comment, Contributor, Issue, Project
 
 
 class ProjectSerializer(serializers.ModelSerializer):
@@ -15,6 +15,18 @@ class ProjectSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "author"]
 
 
+class ProjectSummarySerializer(ProjectSerializer):
+    """Sérialiseur pour le modèle Project avec résumé d'activité (annotations de `with_activity_summary`
+    et date de dernière activité)."""
+
+    open_issues_count = serializers.IntegerField(read_only=True)
+    contributors_count = serializers.IntegerField(read_only=True)
+    last_activity = serializers.DateTimeField(read_only=True)
+
+    class Meta(ProjectSerializer.Meta):
+        fields = ProjectSerializer.Meta.fields + ["open_issues_count", "contributors_count", "last_activity"]
+
+
 class ContributorSerializer(serializers.ModelSerializer):
     """Sérialiseur pour le modèle Contributor."""
 
@@ -35,6 +47,25 @@ class ContributorSerializer(serializers.ModelSerializer):
         return data
 
 
+class ContributorBatchSerializer(serializers.Serializer):
+    """Sérialiseur pour l'ajout/retrait de plusieurs contributeurs en une requête."""
+
+    add = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), required=False, default=list, max_length=500
+    )
+    remove = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), required=False, default=list, max_length=500
+    )
+
+    def validate(self, data):
+        """Valide qu'un même utilisateur n'est pas à la fois ajouté et retiré."""
+        if set(data["add"]) & set(data["remove"]):
+            raise serializers.ValidationError("Un utilisateur ne peut pas être à la fois ajouté et retiré.")
+        if not data["add"] and not data["remove"]:
+            raise serializers.ValidationError("Aucun utilisateur à ajouter ou retirer.")
+        return data
+
+
 class IssueSerializer(serializers.ModelSerializer):
     """Sérialiseur pour le modèle Issue."""
 
@@ -75,6 +106,39 @@ class IssueSerializer(serializers.ModelSerializer):
         return data
 
 
+class IssueBulkFilterSerializer(serializers.Serializer):
+    """Critères de sélection des issues d'une mise à jour par lot."""
+
+    status = serializers.ChoiceField(choices=Issue.STATUS_CHOICES, required=False)
+    priority = serializers.ChoiceField(choices=Issue.PRIORITY_CHOICES, required=False)
+    tag = serializers.ChoiceField(choices=Issue.TAG_CHOICES, required=False)
+    attribution = serializers.IntegerField(min_value=1, required=False)
+
+
+class IssueBulkChangesSerializer(serializers.Serializer):
+    """Modifications applicables à toutes les issues d'une mise à jour par lot."""
+
+    status = serializers.ChoiceField(choices=Issue.STATUS_CHOICES, required=False)
+    priority = serializers.ChoiceField(choices=Issue.PRIORITY_CHOICES, required=False)
+    attribution = serializers.IntegerField(min_value=1, required=False)
+
+
+class IssueBulkUpdateSerializer(serializers.Serializer):
+    """Sérialiseur pour la mise à jour par lot d'issues : une liste d'id et/ou un filtre, et les modifications."""
+
+    ids = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False, max_length=1000)
+    filter = IssueBulkFilterSerializer(required=False)
+    changes = IssueBulkChangesSerializer()
+
+    def validate(self, data):
+        """Valide qu'une sélection et au moins une modification sont fournies."""
+        if not data.get("ids") and not data.get("filter"):
+            raise serializers.ValidationError("Indiquez les issues à modifier avec 'ids' ou 'filter'.")
+        if not data["changes"]:
+            raise serializers.ValidationError("Aucune modification demandée.")
+        return data
+
+
 class CommentSerializer(serializers.ModelSerializer):
     """Sérialiseur pour le modèle Comment."""
 
@@ -84,3 +148,39 @@ class CommentSerializer(serializers.ModelSerializer):
     class Meta:
         model = Comment
         fields = ["id", "issue", "author", "description", "uuid", "created_time"]
+
+
+class ArchivedIssueSerializer(serializers.ModelSerializer):
+    """Sérialiseur en lecture seule pour le modèle ArchivedIssue."""
+
+    class Meta:
+        model = ArchivedIssue
+        fields = [
+            "id",
+            "project",
+            "name",
+            "description",
+            "priority",
+            "tag",
+            "status",
+            "attribution",
+            "created_time",
+            "finished_time",
+            "archived_time",
+        ]
+        read_only_fields = fields
+
+
+class ArchivedCommentSerializer(serializers.ModelSerializer):
+    """Sérialiseur en lecture seule pour le modèle ArchivedComment."""
+
+    class Meta:
+        model = ArchivedComment
+        fields = ["id", "issue", "description", "uuid", "created_time"]
+        read_only_fields = fields
+
+
+class IssueReopenSerializer(serializers.Serializer):
+    """Sérialiseur pour la réouverture d'une issue archivée."""
+
+    status = serializers.ChoiceField(choices=["to-do", "in-progress"], default="to-do")
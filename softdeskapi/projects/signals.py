@@ -0,0 +1,13 @@
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+from users.tokens import invalidate_membership_claims
+
+from .models import Contributor, Project
+
+
+@receiver(pre_delete, sender=Project)
+def invalidate_project_members_claims(sender, instance, **kwargs):
+    """Invalide les tokens d'accès des contributeurs d'un projet supprimé (les lignes Contributor sont
+    supprimées en cascade, sans passer par ContributorViewSet) : un seul UPDATE pour tous les membres.
+    """
+    invalidate_membership_claims(list(Contributor.objects.filter(project=instance).values_list("user_id", flat=True)))
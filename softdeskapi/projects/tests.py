@@ -0,0 +1,277 @@
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+from users.models import User
+from users.tokens import MEMBERSHIP_VERSION_CLAIM, PROJECTS_CLAIM, RevocableRefreshToken
+
+from .archive import archive_finished_issues
+from .models import ArchivedIssue, Comment, Contributor, Issue, Project
+
+
+@override_settings(TOKEN_MEMBERSHIP_CLAIMS=True)
+class TokenMembershipTests(TestCase):
+    """Accès aux routes imbriquées d'un projet avec les projets embarqués dans le token d'accès (IsContributor)."""
+
+    def setUp(self):
+        self.owner = User.objects.create_user(email="owner@softdesk.fr", password="pw12345!ab", age=30)
+        self.member = User.objects.create_user(email="member@softdesk.fr", password="pw12345!ab", age=30)
+        self.project = Project.objects.create(author=self.owner, name="projet", description="description")
+        Contributor.objects.create(user=self.owner, project=self.project, author=True)
+        self.issues_url = f"/projects/{self.project.id}/issues/"
+
+    def client_for(self, user):
+        """Client authentifié avec un token d'accès émis maintenant (comme à la connexion)."""
+        client = APIClient()
+        access = RevocableRefreshToken.for_user(user).access_token
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+        return client, access
+
+    def test_token_embeds_projects_and_version(self):
+        Contributor.objects.create(user=self.member, project=self.project)
+        _, access = self.client_for(self.member)
+
+        self.assertEqual(access[PROJECTS_CLAIM], [self.project.id])
+        self.assertEqual(access[MEMBERSHIP_VERSION_CLAIM], 0)
+
+    def test_contributor_is_allowed_with_token(self):
+        Contributor.objects.create(user=self.member, project=self.project)
+        client, _ = self.client_for(self.member)
+
+        self.assertEqual(client.get(self.issues_url).status_code, status.HTTP_200_OK)
+
+    def test_removed_contributor_is_denied_with_token_issued_before_removal(self):
+        contributor = Contributor.objects.create(user=self.member, project=self.project)
+        client, _ = self.client_for(self.member)
+        owner_client, _ = self.client_for(self.owner)
+
+        response = owner_client.delete(f"/projects/{self.project.id}/contributors/{contributor.id}/")
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(client.get(self.issues_url).status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_project_deletion_invalidates_members_tokens(self):
+        Contributor.objects.create(user=self.member, project=self.project)
+        owner_client, _ = self.client_for(self.owner)
+
+        # contributeurs supprimés en cascade : le signal pre_delete du projet invalide leurs tokens
+        response = owner_client.delete(f"/projects/{self.project.id}/")
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.member.refresh_from_db()
+        self.owner.refresh_from_db()
+        self.assertEqual((self.member.membership_version, self.owner.membership_version), (1, 1))
+
+    def test_batch_removed_contributor_is_denied(self):
+        Contributor.objects.create(user=self.member, project=self.project)
+        client, _ = self.client_for(self.member)
+        owner_client, _ = self.client_for(self.owner)
+
+        response = owner_client.post(
+            f"/projects/{self.project.id}/contributors/batch/", {"remove": [self.member.id]}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(client.get(self.issues_url).status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_contributor_added_after_login_is_allowed_by_database_fallback(self):
+        client, access = self.client_for(self.member)
+        self.assertNotIn(self.project.id, access[PROJECTS_CLAIM])
+
+        Contributor.objects.create(user=self.member, project=self.project)
+        self.assertEqual(client.get(self.issues_url).status_code, status.HTTP_200_OK)
+
+    def test_non_contributor_is_denied_on_nested_list(self):
+        client, _ = self.client_for(self.member)
+
+        self.assertEqual(client.get(self.issues_url).status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(client.get(f"{self.issues_url}?page_size=5").status_code, status.HTTP_403_FORBIDDEN)
+
+    @override_settings(TOKEN_MEMBERSHIP_CLAIMS=False)
+    def test_mode_disabled_uses_database(self):
+        Contributor.objects.create(user=self.member, project=self.project)
+        client, access = self.client_for(self.member)
+
+        self.assertNotIn(PROJECTS_CLAIM, access)
+        self.assertEqual(client.get(self.issues_url).status_code, status.HTTP_200_OK)
+
+    @override_settings(TOKEN_MEMBERSHIP_CLAIMS=False)
+    def test_mode_disabled_does_not_bump_version(self):
+        contributor = Contributor.objects.create(user=self.member, project=self.project)
+        owner_client, _ = self.client_for(self.owner)
+
+        owner_client.delete(f"/projects/{self.project.id}/contributors/{contributor.id}/")
+        self.member.refresh_from_db()
+        self.assertEqual(self.member.membership_version, 0)
+
+
+class IssueArchiveTests(TestCase):
+    """Archivage des issues terminées, liste avec `?include_archived=true` et réouverture."""
+
+    def setUp(self):
+        now = timezone.now()
+        self.owner = User.objects.create_user(email="owner@softdesk.fr", password="pw12345!ab", age=30)
+        self.project = Project.objects.create(author=self.owner, name="projet", description="description")
+        Contributor.objects.create(user=self.owner, project=self.project, author=True)
+        self.active = Issue.objects.create(
+            project=self.project, author=self.owner, attribution=self.owner, name="active"
+        )
+        self.finished = Issue.objects.create(
+            project=self.project, author=self.owner, attribution=self.owner, name="terminée", status="finished"
+        )
+        self.comment = Comment.objects.create(issue=self.finished, author=self.owner, description="commentaire")
+
+        # dates d'origine : le commentaire de l'issue terminée est l'activité la plus récente du projet
+        Project.objects.filter(id=self.project.id).update(created_time=now - timedelta(days=300))
+        Issue.objects.filter(id=self.active.id).update(created_time=now - timedelta(days=200))
+        Issue.objects.filter(id=self.finished.id).update(
+            created_time=now - timedelta(days=150), finished_time=now - timedelta(days=120)
+        )
+        Comment.objects.filter(id=self.comment.id).update(created_time=now - timedelta(days=100))
+        Project.objects.filter(id=self.project.id).refresh_last_activity()
+        self.finished.refresh_from_db()
+        self.comment.refresh_from_db()
+        self.last_activity = Project.objects.get(id=self.project.id).last_activity
+
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def test_archive_list_and_reopen_round_trip(self):
+        self.assertEqual(archive_finished_issues(older_than_days=90), 1)
+        self.assertFalse(Issue.objects.filter(id=self.finished.id).exists())
+        # sans l'issue archivée, la dernière activité est la création de l'issue active
+        self.assertEqual(
+            Project.objects.get(id=self.project.id).last_activity, Issue.objects.get(id=self.active.id).created_time
+        )
+
+        response = self.client.get(f"/projects/{self.project.id}/issues/?include_archived=true")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [(issue["id"], issue["archived"]) for issue in response.data["results"]],
+            [(self.finished.id, True), (self.active.id, False)],
+        )
+
+        response = self.client.post(f"/projects/{self.project.id}/archived-issues/{self.finished.id}/reopen/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(ArchivedIssue.objects.exists())
+
+        # même id et mêmes dates d'origine pour l'issue et son commentaire, dernière activité recalculée
+        issue = Issue.objects.get(id=self.finished.id)
+        self.assertEqual((issue.status, issue.created_time), ("to-do", self.finished.created_time))
+        self.assertIsNone(issue.finished_time)
+        comment = Comment.objects.get(id=self.comment.id)
+        self.assertEqual((comment.issue_id, comment.uuid), (issue.id, self.comment.uuid))
+        self.assertEqual(comment.created_time, self.comment.created_time)
+        self.assertEqual(Project.objects.get(id=self.project.id).last_activity, self.last_activity)
+
+
+class IssueBulkUpdateTests(TestCase):
+    """Mise à jour par lot d'issues : seules celles dont l'utilisateur est l'auteur sont modifiées."""
+
+    def setUp(self):
+        self.owner = User.objects.create_user(email="owner@softdesk.fr", password="pw12345!ab", age=30)
+        self.member = User.objects.create_user(email="member@softdesk.fr", password="pw12345!ab", age=30)
+        self.outsider = User.objects.create_user(email="outsider@softdesk.fr", password="pw12345!ab", age=30)
+        self.project = Project.objects.create(author=self.owner, name="projet", description="description")
+        Contributor.objects.create(user=self.owner, project=self.project, author=True)
+        Contributor.objects.create(user=self.member, project=self.project)
+        self.own = Issue.objects.create(project=self.project, author=self.owner, attribution=self.owner, name="a")
+        self.other = Issue.objects.create(
+            project=self.project, author=self.member, attribution=self.member, name="b"
+        )
+        self.url = f"/projects/{self.project.id}/issues/bulk_update/"
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def test_mixed_authors_and_missing_ids(self):
+        missing_id = self.other.id + 100
+        ids = [self.own.id, self.other.id, missing_id]
+        response = self.client.patch(self.url, {"ids": ids, "changes": {"status": "finished"}}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["updated"], [self.own.id])
+        self.assertEqual(
+            response.data["rejected"],
+            [{"id": self.other.id, "reason": "not_author"}, {"id": missing_id, "reason": "not_found"}],
+        )
+        self.own.refresh_from_db()
+        self.other.refresh_from_db()
+        self.assertEqual(self.own.status, "finished")
+        self.assertIsNotNone(self.own.finished_time)
+        self.assertEqual((self.other.status, self.other.finished_time), ("to-do", None))
+
+    def test_finished_time_is_kept_then_cleared(self):
+        changes = {"ids": [self.own.id], "changes": {"status": "finished"}}
+        self.client.patch(self.url, changes, format="json")
+        self.own.refresh_from_db()
+        finished_time = self.own.finished_time
+
+        # déjà terminée : la date de passage au statut "finished" n'est pas avancée
+        self.client.patch(self.url, changes, format="json")
+        self.own.refresh_from_db()
+        self.assertEqual(self.own.finished_time, finished_time)
+
+        self.client.patch(self.url, {"ids": [self.own.id], "changes": {"status": "in-progress"}}, format="json")
+        self.own.refresh_from_db()
+        self.assertIsNone(self.own.finished_time)
+
+    def test_assignee_must_be_contributor(self):
+        response = self.client.patch(
+            self.url, {"ids": [self.own.id], "changes": {"attribution": self.outsider.id}}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.own.refresh_from_db()
+        self.assertEqual(self.own.attribution_id, self.owner.id)
+
+
+class StreamingListTests(TestCase):
+    """Listes en flux (StreamingJSONRenderer) : même contenu, octet pour octet, que le rendu JSONRenderer."""
+
+    def setUp(self):
+        self.owner = User.objects.create_user(email="owner@softdesk.fr", password="pw12345!ab", age=30)
+        self.project = Project.objects.create(author=self.owner, name="projet", description="description")
+        Contributor.objects.create(user=self.owner, project=self.project, author=True)
+        # caractères non ASCII, guillemets et séparateurs de ligne Unicode (échappés par JSONRenderer)
+        description = 'été \u2028 \u2029 "guillemets"'
+        issue = Issue.objects.bulk_create(
+            [
+                Issue(
+                    project=self.project,
+                    author=self.owner,
+                    attribution=self.owner,
+                    name=f"issue {i}",
+                    description=description,
+                )
+                for i in range(5)
+            ]
+        )[0]
+        Comment.objects.create(issue=issue, author=self.owner, description="commentaire")
+        self.urls = [
+            f"/projects/{self.project.id}/issues/?page_size=2&page=2",
+            f"/projects/{self.project.id}/issues/{issue.id}/comments/",
+        ]
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def rendered(self, url):
+        """Réponse habituelle de DRF (indent demandé, donc sans flux), rendue en JSON compact par JSONRenderer."""
+        response = self.client.get(url, HTTP_ACCEPT="application/json; indent=4")
+        self.assertFalse(response.streaming)
+        return JSONRenderer().render(response.data)
+
+    def test_streamed_list_matches_json_renderer(self):
+        for url in self.urls:
+            response = self.client.get(url)
+            self.assertTrue(response.streaming)
+            self.assertEqual(b"".join(response.streaming_content), self.rendered(url))
+
+    async def test_streamed_list_under_asgi_matches_json_renderer(self):
+        headers = {"Authorization": f"Bearer {await sync_to_async(AccessToken.for_user)(self.owner)}"}
+        for url in self.urls:
+            response = await self.async_client.get(url, headers=headers)
+            self.assertTrue(response.is_async)
+            body = b"".join([chunk async for chunk in response.streaming_content])
+            self.assertEqual(body, await sync_to_async(self.rendered)(url))
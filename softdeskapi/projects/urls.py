@@ -1,7 +1,7 @@
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
-from .views import CommentViewSet, ContributorViewSet, IssueViewSet, ProjectViewSet
+from .views import ArchivedIssueViewSet, CommentViewSet, ContributorViewSet, IssueViewSet, ProjectViewSet
 
 # Crée un routeur qui gère les routes automatiquement pour chaque ViewSet
 router = DefaultRouter()
@@ -12,6 +12,8 @@ router.register(r"", ProjectViewSet, basename="project")
 router.register(r"(?P<project>\d+)/contributors", ContributorViewSet, basename="contributor")
 # Enregistre le ViewSet pour les issues, avec project en paramètre d'URL
 router.register(r"(?P<project>\d+)/issues", IssueViewSet, basename="issue")
+# Enregistre le ViewSet (lecture seule) pour les issues archivées, avec project en paramètre d'URL
+router.register(r"(?P<project>\d+)/archived-issues", ArchivedIssueViewSet, basename="archived-issue")
 # Enregistre le ViewSet pour les commentaires, avec project et issue en paramètres d'URL
 router.register(r"(?P<project>\d+)/issues/(?P<issue>\d+)/comments", CommentViewSet, basename="comment")
 # Utilise les URLs générées automatiquement par le routeur
@@ -1,12 +1,36 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import transaction
+from django.db.models import BooleanField, Value
+from django.db.models.functions import Coalesce
 from django.shortcuts import get_object_or_404
-from rest_framework import viewsets
-from rest_framework.exceptions import PermissionDenied
-from rest_framework.pagination import PageNumberPagination
+from django.utils import timezone
+from rest_framework import generics, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import PermissionDenied, ValidationError
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from softdeskapi.streaming import StreamingListMixin, StreamingPaginationMixin
+from users.tokens import invalidate_membership_claims
 
-from .models import Comment, Contributor, Issue, Project
+from .archive import restore_issue
+from .counts import COUNT_CACHE_TIMEOUT, adjust_count, comment_count_key, issue_count_key
+from .models import ArchivedIssue, Comment, Contributor, Issue, Project
 from .permissions import IsAuthorOrReadOnly, IsContributor
-from .serializers import CommentSerializer, ContributorSerializer, IssueSerializer, ProjectSerializer
+from .serializers import (
+    ArchivedCommentSerializer,
+    ArchivedIssueSerializer,
+    CommentSerializer,
+    ContributorBatchSerializer,
+    ContributorSerializer,
+    IssueBulkUpdateSerializer,
+    IssueReopenSerializer,
+    IssueSerializer,
+    ProjectSerializer,
+    ProjectSummarySerializer,
+)
 
 
 class ProjectPagination(PageNumberPagination):
@@ -15,6 +39,67 @@ class ProjectPagination(PageNumberPagination):
     page_size = 10  # nombre maximum d'éléments par page
 
 
+class CountedPaginator(Paginator):
+    """Paginator Django auquel on peut fournir le nombre total d'éléments (évite le COUNT(*))."""
+
+    def __init__(self, object_list, per_page, count=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        if count is not None:
+            # pré-remplit la cached_property `count`
+            self.__dict__["count"] = count
+
+
+class CachedCountPagination(ProjectPagination):
+    """Pagination par numéro de page dont le total provient d'un nombre en cache, tenu à jour par la vue
+    (clé donnée par `view.get_count_cache_key()`). Le COUNT(*) exact n'est refait que sous
+    `exact_count_threshold` éléments ; au-delà, le total est une estimation (`count_exact` à false).
+    """
+
+    exact_count_threshold = 1000
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.view = view
+        return super().paginate_queryset(queryset, request, view)
+
+    def django_paginator_class(self, object_list, per_page):
+        """Construit le paginator (appelé par PageNumberPagination.paginate_queryset) avec le total de get_count."""
+        count, self.count_exact = self.get_count(object_list, self.view)
+        return CountedPaginator(object_list, per_page, count=count)
+
+    def get_count(self, queryset, view):
+        """Renvoie (nombre total, exact ?)."""
+        key = view.get_count_cache_key() if hasattr(view, "get_count_cache_key") else None
+        if key is None:
+            return queryset.count(), True
+        cached = cache.get(key)
+        if cached is not None and cached >= self.exact_count_threshold:
+            return cached, False
+        count = queryset.count()
+        cache.set(key, count, COUNT_CACHE_TIMEOUT)
+        return count, True
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        response.data["count_exact"] = self.count_exact
+        return response
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["properties"]["count_exact"] = {"type": "boolean"}
+        return response_schema
+
+
+class StreamingCachedCountPagination(StreamingPaginationMixin, CachedCountPagination):
+    """Pagination à total en cache dont les pages (`?page_size=` jusqu'à 1000) sont envoyées en flux."""
+
+
+class AssignedIssuePagination(CursorPagination):
+    """Pagination par curseur sur la date de création : coût constant quelle que soit la page demandée."""
+
+    page_size = 10
+    ordering = "-created_time"
+
+
 class ProjectViewSet(viewsets.ModelViewSet):
     """ViewSet pour gérer les opérations CRUD sur les projets.
     Seuls les auteurs peuvent modifier ou supprimer les projets,
@@ -25,11 +110,34 @@ class ProjectViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated, IsContributor, IsAuthorOrReadOnly]
     pagination_class = ProjectPagination
 
+    # tris acceptés par le paramètre `?ordering=` de la liste (servis par l'index (last_activity, id) de Project)
+    ordering_fields = {"last_activity": ("last_activity", "id"), "-last_activity": ("-last_activity", "-id")}
+
+    def wants_summary(self):
+        """Le résumé d'activité est calculé pour la liste avec `?summary=true` ou un tri par dernière activité."""
+        return self.action == "list" and (
+            self.request.query_params.get("summary") in ("true", "1")
+            or self.request.query_params.get("ordering") in self.ordering_fields
+        )
+
+    def get_serializer_class(self):
+        if self.wants_summary():
+            return ProjectSummarySerializer
+        return ProjectSerializer
+
     def get_queryset(self):
         """Récupère pour afficher tous les projets dont l'utilisateur est contributeur
         avec leurs auteurs en évitant les requêtes supplémentaires grâce à select_related.
+        Avec `?summary=true`, ajoute nombre d'issues ouvertes et nombre de contributeurs, calculés en
+        sous-requêtes dans la même requête SQL (aucune requête par projet), et la date de dernière activité.
         """
-        return Project.objects.select_related("author").filter(contributed_by__user=self.request.user)
+        queryset = Project.objects.select_related("author").filter(contributed_by__user=self.request.user)
+        if self.wants_summary():
+            queryset = queryset.with_activity_summary()
+            ordering = self.request.query_params.get("ordering")
+            if ordering in self.ordering_fields:
+                queryset = queryset.order_by(*self.ordering_fields[ordering])
+        return queryset
 
     def perform_create(self, serializer):
         """
@@ -74,8 +182,77 @@ class ContributorViewSet(viewsets.ModelViewSet):
         # Enregistre le contributeur en liant le projet et l'utilisateur actuel
         serializer.save(project=project, user=self.request.user)
 
+    def perform_destroy(self, instance):
+        """Retire le contributeur et invalide les projets embarqués dans ses tokens d'accès."""
+        with transaction.atomic():
+            instance.delete()
+            invalidate_membership_claims([instance.user_id])
+
+    @action(detail=False, methods=["post"])
+    def batch(self, request, project=None):
+        """Ajoute et/ou retire plusieurs contributeurs en une requête (réservé à l'auteur du projet).
+        Body : {"add": [<user_id>, ...], "remove": [<user_id>, ...]}
+        Renvoie le résultat pour chaque utilisateur : added, already_contributor, unknown_user,
+        removed, not_contributor ou is_author (l'auteur du projet ne peut pas être retiré).
+        """
+        serializer = ContributorBatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        to_add = list(dict.fromkeys(serializer.validated_data["add"]))
+        to_remove = list(dict.fromkeys(serializer.validated_data["remove"]))
+
+        project = get_object_or_404(Project, id=self.kwargs["project"])
+        if project.author_id != request.user.id:
+            raise PermissionDenied("Seul l'auteur du projet peut gérer les contributeurs par lot.")
+
+        results = {}
+        with transaction.atomic():
+            # une seule requête IN pour connaître les appartenances existantes des utilisateurs concernés
+            memberships = dict(
+                Contributor.objects.filter(project=project, user_id__in=to_add + to_remove).values_list(
+                    "user_id", "author"
+                )
+            )
+
+            if to_add:
+                candidates = [user_id for user_id in to_add if user_id not in memberships]
+                existing_users = set(
+                    get_user_model().objects.filter(id__in=candidates).values_list("id", flat=True)
+                )
+                new_contributors = [
+                    Contributor(user_id=user_id, project=project) for user_id in candidates if user_id in existing_users
+                ]
+                # ignore_conflicts : une insertion concurrente d'un même couple (user, project) est ignorée
+                # grâce à la contrainte unique_together au lieu de faire échouer tout le lot
+                Contributor.objects.bulk_create(new_contributors, ignore_conflicts=True)
+                for user_id in to_add:
+                    if user_id in memberships:
+                        results[user_id] = "already_contributor"
+                    elif user_id in existing_users:
+                        results[user_id] = "added"
+                    else:
+                        results[user_id] = "unknown_user"
+
+            if to_remove:
+                removable = [user_id for user_id in to_remove if memberships.get(user_id) is False]
+                # une seule requête DELETE pour tous les retraits, puis un seul UPDATE pour invalider
+                # les projets embarqués dans les tokens des retirés
+                Contributor.objects.filter(project=project, user_id__in=removable, author=False).delete()
+                invalidate_membership_claims(removable)
+                for user_id in to_remove:
+                    if user_id not in memberships:
+                        results[user_id] = "not_contributor"
+                    elif memberships[user_id]:
+                        results[user_id] = "is_author"
+                    else:
+                        results[user_id] = "removed"
 
-class IssueViewSet(viewsets.ModelViewSet):
+        return Response(
+            {"results": [{"user": user_id, "result": result} for user_id, result in results.items()]},
+            status=status.HTTP_200_OK,
+        )
+
+
+class IssueViewSet(StreamingListMixin, viewsets.ModelViewSet):
     """ViewSet pour gérer les issues dans un projet.
     Seuls les auteurs d'une issue peuvent la modifier ou la supprimer,
     mais tous les utilisateurs authentifiés peuvent lire et créer des issues.
@@ -83,7 +260,7 @@ class IssueViewSet(viewsets.ModelViewSet):
 
     serializer_class = IssueSerializer
     permission_classes = [IsAuthenticated, IsContributor, IsAuthorOrReadOnly]
-    pagination_class = ProjectPagination
+    pagination_class = StreamingCachedCountPagination
 
     def get_queryset(self):
         """Récupère toutes les issues pour un projet donné.
@@ -100,8 +277,172 @@ class IssueViewSet(viewsets.ModelViewSet):
         context["project"] = get_object_or_404(Project, id=self.kwargs["project"])
         return context
 
+    def get_count_cache_key(self):
+        """Clé du nombre d'issues en cache pour la pagination (sans objet si les archives sont incluses)."""
+        if self.request.query_params.get("include_archived") in ("true", "1"):
+            return None
+        return issue_count_key(self.kwargs["project"])
+
+    def perform_create(self, serializer):
+        serializer.save()
+        adjust_count(issue_count_key(self.kwargs["project"]), 1)
+
+    def perform_destroy(self, instance):
+        instance.delete()
+        adjust_count(issue_count_key(self.kwargs["project"]), -1)
+        cache.delete(comment_count_key(self.kwargs["project"], instance.id))
+
+    def list(self, request, *args, **kwargs):
+        """Liste les issues du projet. Avec `?include_archived=true`, inclut aussi les issues archivées
+        (champ `archived` dans chaque résultat), triées par date de création décroissante.
+        """
+        if request.query_params.get("include_archived") not in ("true", "1"):
+            return super().list(request, *args, **kwargs)
+
+        project_id = self.kwargs["project"]
+        # pagination sur l'union des (id, date, archivée) des deux tables, puis chargement de la seule page
+        hot = (
+            Issue.objects.filter(project_id=project_id)
+            .annotate(archived=Value(False, output_field=BooleanField()))
+            .values_list("id", "created_time", "archived")
+        )
+        cold = (
+            ArchivedIssue.objects.filter(project_id=project_id)
+            .annotate(archived=Value(True, output_field=BooleanField()))
+            .values_list("id", "created_time", "archived")
+        )
+        page = self.paginate_queryset(hot.union(cold, all=True).order_by("-created_time", "-id"))
+
+        hot_ids = [row[0] for row in page if not row[2]]
+        cold_ids = [row[0] for row in page if row[2]]
+        issues = {issue.id: issue for issue in self.get_queryset().filter(id__in=hot_ids)}
+        archived_issues = {issue.id: issue for issue in ArchivedIssue.objects.filter(id__in=cold_ids)}
+        # une issue archivée ou rouverte entre la pagination et ces requêtes a changé de table (même id) :
+        # elle est cherchée dans l'autre table ; une issue supprimée entre-temps est omise de la page
+        moved_to_cold = [issue_id for issue_id in hot_ids if issue_id not in issues]
+        moved_to_hot = [issue_id for issue_id in cold_ids if issue_id not in archived_issues]
+        if moved_to_cold:
+            archived_issues.update(
+                {issue.id: issue for issue in ArchivedIssue.objects.filter(id__in=moved_to_cold)}
+            )
+        if moved_to_hot:
+            issues.update({issue.id: issue for issue in self.get_queryset().filter(id__in=moved_to_hot)})
+
+        results = []
+        for issue_id, _, archived in page:
+            if issue_id in archived_issues and (archived or issue_id not in issues):
+                data = ArchivedIssueSerializer(archived_issues[issue_id]).data
+                data["archived"] = True
+            elif issue_id in issues:
+                data = self.get_serializer(issues[issue_id]).data
+                data["archived"] = False
+            else:
+                continue
+            results.append(data)
+        return self.get_paginated_response(results)
+
+    @action(detail=False, methods=["patch"])
+    def bulk_update(self, request, project=None):
+        """Modifie status, priority et/ou attribution de plusieurs issues du projet en une requête.
+        Body : {"ids": [...]} et/ou {"filter": {...}}, plus {"changes": {...}}.
+        Seules les issues dont l'utilisateur est l'auteur sont modifiées, en un seul UPDATE ;
+        les autres sont renvoyées dans `rejected` avec la raison (not_author, not_found).
+        """
+        serializer = IssueBulkUpdateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ids = serializer.validated_data.get("ids")
+        filters = serializer.validated_data.get("filter") or {}
+        changes = dict(serializer.validated_data["changes"])
+        project_id = self.kwargs["project"]
+
+        if "attribution" in changes:
+            changes["attribution_id"] = changes.pop("attribution")
+        if "attribution" in filters:
+            filters["attribution_id"] = filters.pop("attribution")
+
+        # tenir à jour la date de passage au statut "finished" comme Issue.save
+        if changes.get("status") == "finished":
+            changes["finished_time"] = Coalesce("finished_time", Value(timezone.now()))
+        elif "status" in changes:
+            changes["finished_time"] = None
+
+        with transaction.atomic():
+            # L'utilisateur assigné doit être contributeur du projet (une seule requête pour tout le lot),
+            # vérifié dans la transaction de l'UPDATE : il ne peut pas être retiré du projet entre les deux
+            if "attribution_id" in changes and not Contributor.objects.filter(
+                project_id=project_id, user_id=changes["attribution_id"]
+            ).exists():
+                raise ValidationError(
+                    {"attribution": "L'utilisateur assigné doit être un contributeur de ce projet."}
+                )
+            targets = Issue.objects.filter(project_id=project_id, **filters)
+            if ids is not None:
+                targets = targets.filter(id__in=ids)
+            # vérification d'auteur ensembliste : une seule requête pour tout le lot
+            authors = dict(targets.values_list("id", "author_id"))
+            updated = sorted(issue_id for issue_id, author_id in authors.items() if author_id == request.user.id)
+            Issue.objects.filter(id__in=updated).update(**changes)
+
+        rejected = [{"id": issue_id, "reason": "not_author"} for issue_id in sorted(set(authors) - set(updated))]
+        if ids is not None:
+            missing = [issue_id for issue_id in dict.fromkeys(ids) if issue_id not in authors]
+            rejected += [{"id": issue_id, "reason": "not_found"} for issue_id in missing]
+        return Response({"updated": updated, "rejected": rejected}, status=status.HTTP_200_OK)
+
+
+class AssignedIssueListView(generics.ListAPIView):
+    """Vue listant les issues assignées à l'utilisateur, tous projets confondus (projets dont il est contributeur).
+    Filtre optionnel `?status=` (to-do, in-progress, finished).
+    """
+
+    serializer_class = IssueSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = AssignedIssuePagination
 
-class CommentViewSet(viewsets.ModelViewSet):
+    def get_queryset(self):
+        """Issues assignées à l'utilisateur, servies par l'index (attribution, created_time, status)."""
+        queryset = Issue.objects.filter(
+            attribution=self.request.user,
+            project_id__in=Contributor.objects.filter(user=self.request.user).values("project_id"),
+        )
+        status_filter = self.request.query_params.get("status")
+        if status_filter in dict(Issue.STATUS_CHOICES):
+            queryset = queryset.filter(status=status_filter)
+        return queryset
+
+
+class ArchivedIssueViewSet(viewsets.ReadOnlyModelViewSet):
+    """ViewSet en lecture seule pour les issues archivées d'un projet.
+    L'auteur d'une issue archivée peut la rouvrir : elle retourne alors, avec ses commentaires,
+    dans les issues actives.
+    """
+
+    serializer_class = ArchivedIssueSerializer
+    permission_classes = [IsAuthenticated, IsContributor, IsAuthorOrReadOnly]
+    pagination_class = ProjectPagination
+
+    def get_queryset(self):
+        """Récupère toutes les issues archivées pour un projet donné."""
+        return ArchivedIssue.objects.filter(project__id=self.kwargs["project"]).order_by("-created_time", "-id")
+
+    @action(detail=True, methods=["get"])
+    def comments(self, request, project=None, pk=None):
+        """Liste les commentaires archivés d'une issue archivée."""
+        archived_issue = self.get_object()
+        page = self.paginate_queryset(archived_issue.comments.order_by("created_time", "id"))
+        return self.get_paginated_response(ArchivedCommentSerializer(page, many=True).data)
+
+    @action(detail=True, methods=["post"])
+    def reopen(self, request, project=None, pk=None):
+        """Rouvre une issue archivée (réservé à son auteur) avec le statut donné ("to-do" par défaut)."""
+        archived_issue = self.get_object()
+        serializer = IssueReopenSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        issue = restore_issue(archived_issue, status=serializer.validated_data["status"])
+        return Response(IssueSerializer(issue).data, status=status.HTTP_200_OK)
+
+
+class CommentViewSet(StreamingListMixin, viewsets.ModelViewSet):
     """ViewSet pour gérer les commentaires sur une issue spécifique.
     Seuls les auteurs d'un commentaire peuvent le modifier ou le supprimer,
     mais tous les utilisateurs authentifiés peuvent lire et créer des commentaires.
@@ -109,7 +450,7 @@ class CommentViewSet(viewsets.ModelViewSet):
 
     serializer_class = CommentSerializer
     permission_classes = [IsAuthenticated, IsContributor, IsAuthorOrReadOnly]
-    pagination_class = ProjectPagination
+    pagination_class = StreamingCachedCountPagination
 
     def get_queryset(self):
         """Récupère tous les commentaires pour une issue donnée dans un projet.
@@ -131,3 +472,12 @@ class CommentViewSet(viewsets.ModelViewSet):
             raise serializer.ValidationError("Cette issue n'appartient pas au projet spécifié.")
         # Crée le commentaire en associant l'auteur et l'issue
         serializer.save(author=self.request.user, issue=issue)
+        adjust_count(comment_count_key(self.kwargs["project"], issue.id), 1)
+
+    def get_count_cache_key(self):
+        """Clé du nombre de commentaires de l'issue en cache pour la pagination."""
+        return comment_count_key(self.kwargs["project"], self.kwargs["issue"])
+
+    def perform_destroy(self, instance):
+        instance.delete()
+        adjust_count(comment_count_key(self.kwargs["project"], self.kwargs["issue"]), -1)
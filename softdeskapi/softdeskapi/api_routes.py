@@ -0,0 +1,22 @@
+from django.conf.urls import include
+from django.urls import path
+from projects.views import AssignedIssueListView, ProjectViewSet
+
+# Routes de l'API communes au profil complet (urls.py) et au profil "API seule" (urls_api.py) :
+# une nouvelle route s'ajoute ici, une seule fois
+
+
+def register_viewsets(router):
+    """Enregistre sur `router` (DefaultRouter ou SimpleRouter selon le profil) les ViewSets de la racine."""
+    router.register(r"projects", ProjectViewSet, basename="project")  # Base URL "/projects/"
+    return router
+
+
+urlpatterns = [
+    # Inclut les URLs supplémentaires de l'application users
+    path("users/", include("users.urls")),
+    # Inclut les URLs supplémentaires de l'application projects
+    path("projects/", include("projects.urls")),
+    # Issues assignées à l'utilisateur, tous projets confondus
+    path("issues/assigned/", AssignedIssueListView.as_view(), name="assigned-issues"),
+]
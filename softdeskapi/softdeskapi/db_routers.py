@@ -0,0 +1,28 @@
+from django.db import connections
+
+
+class PrimaryReplicaRouter:
+    """Routeur de base de données : les lectures passent par la connexion en lecture seule ("replica"),
+    les écritures et les migrations par la connexion principale ("default").
+    """
+
+    primary = "default"
+    replica = "replica"
+
+    def db_for_read(self, model, **hints):
+        # Dans une transaction ouverte sur la connexion principale, on y lit aussi
+        # pour voir les écritures de la transaction qui ne sont pas encore validées
+        if connections[self.primary].in_atomic_block:
+            return self.primary
+        return self.replica
+
+    def db_for_write(self, model, **hints):
+        return self.primary
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Les deux alias pointent vers le même fichier : toutes les relations sont permises
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # La connexion en lecture seule ne doit jamais être migrée
+        return db == self.primary
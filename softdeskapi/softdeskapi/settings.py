@@ -43,7 +43,6 @@ INSTALLED_APPS = [
     "django.contrib.staticfiles",
     "rest_framework",
     "rest_framework_simplejwt",
-    "rest_framework_simplejwt.token_blacklist",
     "users",
     "projects",
 ]
@@ -156,8 +155,26 @@ SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=5),  # Durée de validité du token d'accès
     "REFRESH_TOKEN_LIFETIME": timedelta(days=1),  # Durée de validité du token de rafraîchissement
     "ROTATE_REFRESH_TOKENS": True,
+    # les refresh tokens renouvelés sont révoqués dans users.revocation (lignes purgées à leur expiration)
+    # à la place de l'app token_blacklist dont les tables grossissent sans limite
+    # (révocations existantes reprises par la commande import_blacklisted_tokens)
     "BLACKLIST_AFTER_ROTATION": True,
     "AUTH_HEADER_TYPES": ("Bearer",),
 }
 
+# Mode optionnel (désactivé par défaut) : embarque dans le token d'accès la liste des projets dont l'utilisateur
+# est contributeur ; IsContributor vérifie alors l'appartenance sans requête (repli sur la base si la liste
+# n'est plus à jour)
+TOKEN_MEMBERSHIP_CLAIMS = False
+# Au-delà de ce nombre de projets, la liste n'est pas embarquée (token trop volumineux) : vérification en base
+TOKEN_MEMBERSHIP_CLAIMS_MAX_PROJECTS = 200
+
+# Inscription et connexion (hachage PBKDF2 du mot de passe) servies par un pool borné de threads (users.hashing) :
+# nombre de threads ; 0 (développement, tests) : vues exécutées comme les autres, sans pool.
+# Les threads du pool ont leur propre connexion à la base : ils ne voient pas la transaction d'un TestCase.
+# Activé dans settings_production (et settings_api)
+PASSWORD_HASHING_WORKERS = 0
+# requêtes autorisées à attendre un thread libre ; au-delà, réponse 429 (Retry-After)
+PASSWORD_HASHING_QUEUE_SIZE = 8
+
 AUTH_USER_MODEL = "users.User"
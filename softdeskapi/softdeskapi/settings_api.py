@@ -0,0 +1,45 @@
+"""
+Profil d'exécution "API seule" pour softdeskapi.
+
+Reprend le profil de production (`settings_production.py`) et retire ce dont un service qui ne parle
+que JSON authentifié par JWT n'a pas besoin : admin, sessions, messages, fichiers statiques, CSRF,
+gabarits et API navigable de django-rest-framework. Chaque worker démarre plus vite et chaque requête
+traverse moins de middlewares.
+
+L'admin reste disponible en lançant un processus séparé avec le profil complet (`settings_production`).
+
+Activation : points d'entrée `softdeskapi.wsgi_api` / `softdeskapi.asgi_api`
+(ou DJANGO_SETTINGS_MODULE=softdeskapi.settings_api pour manage.py)
+"""
+
+from .settings_production import *  # noqa: F401,F403
+from .settings_production import REST_FRAMEWORK
+
+INSTALLED_APPS = [
+    "django.contrib.auth",
+    "django.contrib.contenttypes",
+    "rest_framework",
+    "rest_framework_simplejwt",
+    "users",
+    "projects",
+]
+
+# Authentification par JWT (rest_framework_simplejwt) : ni session, ni cookie CSRF, ni messages
+MIDDLEWARE = [
+    "django.middleware.security.SecurityMiddleware",
+    "django.middleware.common.CommonMiddleware",
+]
+
+# Aucune page HTML rendue : pas de moteur de gabarits à initialiser
+TEMPLATES = []
+
+ROOT_URLCONF = "softdeskapi.urls_api"
+
+WSGI_APPLICATION = "softdeskapi.wsgi_api.application"
+
+# JSON uniquement : sans BrowsableAPIRenderer, ni gabarits ni formulaires ne sont chargés pour répondre
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,
+    "DEFAULT_RENDERER_CLASSES": ("rest_framework.renderers.JSONRenderer",),
+    "DEFAULT_PARSER_CLASSES": ("rest_framework.parsers.JSONParser",),
+}
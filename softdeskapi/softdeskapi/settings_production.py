@@ -0,0 +1,115 @@
+"""
+Profil de base de données "production" pour softdeskapi.
+
+Reprend tous les réglages de `settings.py` et remplace : les réglages de sécurité (DEBUG désactivé,
+clé secrète et hôtes autorisés lus dans l'environnement, HTTPS), la configuration SQLite (journal WAL,
+pragmas de performance, connexions persistantes et routage lectures (connexion en lecture seule) /
+écritures (connexion principale)), ainsi que le pool de hachage des mots de passe (inscription, connexion).
+
+Activation : DJANGO_SETTINGS_MODULE=softdeskapi.settings_production
+Variables d'environnement : DJANGO_SECRET_KEY (obligatoire), DJANGO_ALLOWED_HOSTS (noms séparés par des virgules),
+DJANGO_DEBUG=1 (déconseillé)
+"""
+
+import os
+
+from django.core.exceptions import ImproperlyConfigured
+
+from .settings import *  # noqa: F401,F403
+from .settings import BASE_DIR
+
+# Sécurité : settings.py est un profil de développement (DEBUG actif, clé secrète dans le code) dont le bloc
+# "if not DEBUG" a déjà été évalué à l'import : les réglages de production sont donc redéclarés ici
+DEBUG = os.environ.get("DJANGO_DEBUG", "") in ("1", "true", "True")
+
+SECRET_KEY = os.environ.get("DJANGO_SECRET_KEY", "")
+if not SECRET_KEY:
+    raise ImproperlyConfigured("La variable d'environnement DJANGO_SECRET_KEY doit être définie en production")
+
+ALLOWED_HOSTS = [host.strip() for host in os.environ.get("DJANGO_ALLOWED_HOSTS", "").split(",") if host.strip()]
+
+if not DEBUG:
+    SECURE_SSL_REDIRECT = True  # Redirige HTTP vers HTTPS
+    SESSION_COOKIE_SECURE = True  # Utilise HTTPS pour les cookies de session
+    CSRF_COOKIE_SECURE = True  # Utilise HTTPS pour les cookies CSRF
+    SECURE_BROWSER_XSS_FILTER = True  # Active le filtre XSS du navigateur
+    SECURE_CONTENT_TYPE_NOSNIFF = True  # Empêche le navigateur de deviner le type MIME
+    X_FRAME_OPTIONS = "DENY"  # Empêche l'intégration de pages dans des iframes
+
+# Pragmas appliqués à l'ouverture de chaque connexion en écriture :
+# - WAL : les lecteurs ne sont plus bloqués par l'écrivain (et inversement)
+# - synchronous=NORMAL : sûr en mode WAL, évite un fsync à chaque commit
+# - cache_size négatif = taille en KiB (ici ~64 Mo de cache de pages)
+# - mmap_size : lecture des pages par mappage mémoire (256 Mo)
+SQLITE_PRIMARY_PRAGMAS = [
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA temp_store=MEMORY",
+    # statistiques du planificateur (SQLite >= 3.46) : sans elles, le tri de la liste des projets par
+    # dernière activité n'utilise pas l'index (last_activity, id) ; analysis_limit borne le travail
+    # d'ANALYZE à l'ouverture de la connexion (échantillon de lignes par index, pas de parcours complet)
+    "PRAGMA analysis_limit=400",
+    "PRAGMA optimize=0x10002",
+]
+
+# La connexion en lecture seule ne peut pas changer le mode de journal (persistant dans le fichier)
+# query_only garantit qu'aucune écriture ne passe par erreur sur cette connexion
+SQLITE_REPLICA_PRAGMAS = [
+    "PRAGMA query_only=ON",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA temp_store=MEMORY",
+]
+
+# Délai (en secondes) pendant lequel SQLite attend un verrou avant de lever "database is locked"
+SQLITE_BUSY_TIMEOUT = 20
+
+# Durée de vie (en secondes) des connexions persistantes entre deux requêtes
+SQLITE_CONN_MAX_AGE = 600
+
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": BASE_DIR / "db.sqlite3",
+        "CONN_MAX_AGE": SQLITE_CONN_MAX_AGE,
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {
+            "init_command": ";".join(SQLITE_PRIMARY_PRAGMAS),
+            "timeout": SQLITE_BUSY_TIMEOUT,
+            # prend le verrou d'écriture dès le BEGIN : évite les erreurs "database is locked"
+            # quand deux transactions lectrices tentent ensuite d'écrire en même temps
+            "transaction_mode": "IMMEDIATE",
+        },
+    },
+    # Même fichier, ouvert en lecture seule via une URI SQLite (mode=ro)
+    "replica": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": f"file:{BASE_DIR / 'db.sqlite3'}?mode=ro",
+        "CONN_MAX_AGE": SQLITE_CONN_MAX_AGE,
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {
+            "init_command": ";".join(SQLITE_REPLICA_PRAGMAS),
+            "timeout": SQLITE_BUSY_TIMEOUT,
+        },
+        # en test, la connexion de lecture pointe vers la base de test de "default"
+        "TEST": {"MIRROR": "default"},
+    },
+}
+
+DATABASE_ROUTERS = ["softdeskapi.db_routers.PrimaryReplicaRouter"]
+
+# Cache partagé par tous les workers de la machine (nombres d'issues et de commentaires des listes paginées,
+# voir projects.counts) : avec le cache mémoire par défaut, chaque processus tiendrait sa propre estimation.
+# Fichiers plutôt que base de données : les mises à jour des nombres ne prennent pas le verrou d'écriture SQLite
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.environ.get("DJANGO_CACHE_DIR", BASE_DIR / "cache"),
+        "OPTIONS": {"MAX_ENTRIES": 10000},
+    },
+}
+
+# Inscription et connexion servies par le pool borné de users.hashing : la moitié des cœurs
+PASSWORD_HASHING_WORKERS = max((os.cpu_count() or 2) // 2, 1)
@@ -0,0 +1,163 @@
+import datetime
+import uuid
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.core.paginator import InvalidPage
+from django.http import StreamingHttpResponse
+from rest_framework.compat import LONG_SEPARATORS, SHORT_SEPARATORS
+from rest_framework.exceptions import NotFound
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils import encoders
+
+
+def _datetime_to_json(value):
+    # même représentation que rest_framework.utils.encoders.JSONEncoder
+    representation = value.isoformat()
+    if representation.endswith("+00:00"):
+        representation = representation[:-6] + "Z"
+    return representation
+
+
+class CachedTypeJSONEncoder(encoders.JSONEncoder):
+    """JSONEncoder de DRF avec une table de conversion par type exact (datetime, UUID...) :
+    une recherche dans un dict au lieu de la cascade d'isinstance de `default` pour chaque valeur.
+    """
+
+    converters = {
+        datetime.datetime: _datetime_to_json,
+        datetime.date: datetime.date.isoformat,
+        uuid.UUID: str,
+    }
+
+    def default(self, obj):
+        converter = self.converters.get(type(obj))
+        if converter is not None:
+            return converter(obj)
+        return super().default(obj)
+
+
+async def iterate_in_sync_thread(iterator):
+    """Itérateur asynchrone sur un itérateur synchrone, dont chaque élément est produit à la demande dans
+    le thread des vues synchrones (celui de la connexion à la base ouverte par la vue).
+    """
+    next_chunk = sync_to_async(next, thread_sensitive=True)
+    while True:
+        chunk = await next_chunk(iterator, None)
+        if chunk is None:
+            return
+        yield chunk
+
+
+class StreamedList:
+    """Liste paresseuse de résultats, encodée élément par élément par StreamingJSONRenderer."""
+
+    def __init__(self, items):
+        self.items = items
+
+
+class StreamingJSONRenderer(JSONRenderer):
+    """Renderer JSON qui produit la réponse par morceaux : les valeurs StreamedList sont encodées
+    au fil de l'itération (une ligne à la fois), sans construire ni la liste, ni la chaîne complète.
+    Le résultat, une fois les morceaux concaténés, est identique à celui de JSONRenderer (mode compact).
+    """
+
+    encoder_class = CachedTypeJSONEncoder
+    # nombre d'éléments encodés regroupés dans un même morceau envoyé au client
+    chunk_rows = 100
+
+    def get_encoder(self):
+        # une seule instance d'encodeur par réponse, réutilisée pour chaque ligne
+        return self.encoder_class(
+            ensure_ascii=self.ensure_ascii,
+            allow_nan=not self.strict,
+            separators=SHORT_SEPARATORS if self.compact else LONG_SEPARATORS,
+        )
+
+    def iter_render(self, data):
+        """Génère les morceaux (bytes) de l'encodage JSON de `data`, un dict dont certaines valeurs
+        peuvent être des StreamedList.
+        """
+        encoder = self.get_encoder()
+        item_separator, key_separator = encoder.item_separator, encoder.key_separator
+        head = []
+        for index, (key, value) in enumerate(data.items()):
+            head.append(("{" if index == 0 else item_separator) + encoder.encode(str(key)) + key_separator)
+            if not isinstance(value, StreamedList):
+                head.append(encoder.encode(value))
+                continue
+            # envoie ce qui précède la liste, puis la liste par paquets de `chunk_rows` éléments
+            yield self.finalize("".join(head) + "[")
+            head = []
+            chunk = []
+            for position, item in enumerate(value.items):
+                chunk.append((item_separator if position else "") + encoder.encode(item))
+                if len(chunk) >= self.chunk_rows:
+                    yield self.finalize("".join(chunk))
+                    chunk = []
+            head = chunk + ["]"]
+        head.append("}" if data else "{}")
+        yield self.finalize("".join(head))
+
+    def finalize(self, text):
+        # comme JSONRenderer : échappe toujours \u2028 et \u2029
+        return text.replace("\u2028", "\\u2028").replace("\u2029", "\\u2029").encode()
+
+
+class StreamingPaginationMixin:
+    """Mixin de pagination par numéro de page qui garde la page paresseuse (queryset non évalué)
+    et renvoie une réponse en flux, encodée par StreamingJSONRenderer au fil de l'itération.
+    À combiner avec une pagination DRF : `class X(StreamingPaginationMixin, PageNumberPagination)`.
+    """
+
+    page_size_query_param = "page_size"
+    max_page_size = 1000
+    # nombre de lignes lues à la fois depuis la base pendant l'envoi de la page
+    iterator_chunk_size = 200
+    renderer_class = StreamingJSONRenderer
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Reprend PageNumberPagination.paginate_queryset sans son `list(self.page)`, qui chargerait
+        toute la page en mémoire : renvoie la page encore non évaluée.
+        """
+        self.request = request
+        self.view = view
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+        paginator = self.django_paginator_class(queryset, page_size)
+        page_number = self.get_page_number(request, paginator)
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            raise NotFound(self.invalid_page_message.format(page_number=page_number, message=str(exc)))
+        return self.page.object_list
+
+    def get_streaming_response(self, serializer, page):
+        """Réponse en flux : chaque objet de la page est lu, sérialisé puis encodé un par un."""
+        object_list = page.iterator(chunk_size=self.iterator_chunk_size) if hasattr(page, "iterator") else page
+        rows = (serializer.child.to_representation(obj) for obj in object_list)
+        # même enveloppe (count, next, previous, results...) que la réponse paginée habituelle
+        data = self.get_paginated_response(StreamedList(rows)).data
+        chunks = self.renderer_class().iter_render(data)
+        if isinstance(self.request._request, ASGIRequest):
+            # sous ASGI, Django lirait un itérateur synchrone en entier (en mémoire) avant de l'envoyer
+            chunks = iterate_in_sync_thread(chunks)
+        return StreamingHttpResponse(chunks, content_type="application/json")
+
+
+class StreamingListMixin:
+    """Mixin de ViewSet dont l'action `list` répond en flux quand la pagination le permet
+    (StreamingPaginationMixin) et que le client accepte du JSON."""
+
+    def list(self, request, *args, **kwargs):
+        page = None
+        if hasattr(self.paginator, "get_streaming_response") and self.accepts_streaming_json(request):
+            page = self.paginate_queryset(self.filter_queryset(self.get_queryset()))
+        if page is None:
+            return super().list(request, *args, **kwargs)
+        return self.paginator.get_streaming_response(self.get_serializer(page, many=True), page)
+
+    def accepts_streaming_json(self, request):
+        # l'API navigable et le JSON indenté (Accept: application/json; indent=4) restent servis par DRF
+        return isinstance(request.accepted_renderer, JSONRenderer) and "indent" not in request.accepted_media_type
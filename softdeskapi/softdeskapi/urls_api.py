@@ -0,0 +1,14 @@
+from django.conf.urls import include
+from django.urls import path
+from rest_framework.routers import SimpleRouter
+
+from . import api_routes
+
+# Routes du profil "API seule" (settings_api) : celles de urls.py, sans l'admin
+# ni la vue racine HTML de DefaultRouter
+router = api_routes.register_viewsets(SimpleRouter())
+
+urlpatterns = [
+    path("", include(router.urls)),
+    *api_routes.urlpatterns,
+]
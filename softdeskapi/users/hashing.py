@@ -0,0 +1,138 @@
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+from django.http import JsonResponse
+from rest_framework import status
+
+
+class PasswordHashingPool:
+    """Pool borné de threads qui exécute les vues d'inscription et de connexion, dont le coût est
+    celui du hachage PBKDF2 du mot de passe.
+
+    - sous ASGI, ces vues ne bloquent plus le thread unique où Django exécute les vues synchrones :
+      les lectures de projets et d'issues continuent d'être servies pendant une rafale d'authentifications ;
+    - le nombre de hachages simultanés est limité à PASSWORD_HASHING_WORKERS (le reste des cœurs reste
+      disponible pour les autres requêtes) ;
+    - au-delà de PASSWORD_HASHING_QUEUE_SIZE requêtes en attente d'un thread, l'API répond 429 ;
+    - le temps d'attente d'un thread et la durée d'exécution sont mesurés par endpoint (`stats`)
+      et renvoyés dans l'en-tête Server-Timing de chaque réponse.
+    """
+
+    # délai (en secondes) conseillé au client par l'en-tête Retry-After d'une réponse 429
+    retry_after = 1
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._executor = None
+        self._slots = None
+        self._stats = {}
+
+    @property
+    def workers(self):
+        # 0 : la vue s'exécute comme une vue synchrone ordinaire (sans pool ni limite)
+        return getattr(settings, "PASSWORD_HASHING_WORKERS", 0)
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                workers = self.workers
+                self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hashing")
+                # une place par thread, plus les requêtes autorisées à attendre qu'un thread se libère
+                self._slots = threading.BoundedSemaphore(
+                    workers + getattr(settings, "PASSWORD_HASHING_QUEUE_SIZE", 8)
+                )
+            return self._executor
+
+    def wrap_view(self, view, endpoint):
+        """Renvoie une vue asynchrone qui exécute la vue synchrone `view` dans le pool."""
+
+        @functools.wraps(view)
+        async def offloaded_view(request, *args, **kwargs):
+            if not self.workers:
+                return await sync_to_async(view)(request, *args, **kwargs)
+
+            executor = self._get_executor()
+            if not self._slots.acquire(blocking=False):
+                self._record(endpoint, rejected=True)
+                return JsonResponse(
+                    {"detail": "Too many authentication requests in progress, please retry shortly."},
+                    status=status.HTTP_429_TOO_MANY_REQUESTS,
+                    headers={"Retry-After": str(self.retry_after)},
+                )
+
+            submitted = time.perf_counter()
+            timings = {}
+
+            def run():
+                started = time.perf_counter()
+                timings["queue"] = started - submitted
+                # thread hors du cycle de requête de Django : même gestion des connexions que
+                # les signaux request_started / request_finished
+                close_old_connections()
+                try:
+                    return view(request, *args, **kwargs)
+                finally:
+                    close_old_connections()
+                    timings["run"] = time.perf_counter() - started
+                    self._slots.release()
+                    self._record(endpoint, timings["queue"], timings["run"])
+
+            response = await sync_to_async(run, thread_sensitive=False, executor=executor)()
+            response["Server-Timing"] = (
+                f"hash-queue;dur={timings['queue'] * 1000:.1f}, hash-run;dur={timings['run'] * 1000:.1f}"
+            )
+            return response
+
+        return offloaded_view
+
+    def _record(self, endpoint, queue_time=0.0, run_time=0.0, rejected=False):
+        with self._lock:
+            stats = self._stats.setdefault(
+                endpoint, {"requests": 0, "rejected": 0, "queue_time": 0.0, "queue_time_max": 0.0, "run_time": 0.0}
+            )
+            if rejected:
+                stats["rejected"] += 1
+                return
+            stats["requests"] += 1
+            stats["queue_time"] += queue_time
+            stats["queue_time_max"] = max(stats["queue_time_max"], queue_time)
+            stats["run_time"] += run_time
+
+    def stats(self):
+        """Métriques par endpoint depuis le démarrage du processus : requêtes traitées et rejetées (429),
+        attente moyenne et maximale d'un thread du pool, durée moyenne d'exécution (en ms).
+        """
+        with self._lock:
+            return {
+                endpoint: {
+                    "requests": stats["requests"],
+                    "rejected": stats["rejected"],
+                    "queue_ms_avg": stats["queue_time"] * 1000 / max(stats["requests"], 1),
+                    "queue_ms_max": stats["queue_time_max"] * 1000,
+                    "run_ms_avg": stats["run_time"] * 1000 / max(stats["requests"], 1),
+                }
+                for endpoint, stats in self._stats.items()
+            }
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats.clear()
+
+
+# pool unique par processus
+hashing_pool = PasswordHashingPool()
+
+
+class OffThreadHashingMixin:
+    """Mixin de vue DRF : la vue est servie par `hashing_pool` sous le nom `hashing_endpoint`."""
+
+    hashing_endpoint = None
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        return hashing_pool.wrap_view(super().as_view(**initkwargs), cls.hashing_endpoint or cls.__name__)
@@ -0,0 +1,109 @@
+import asyncio
+import json
+import os
+import statistics
+import time
+
+from django.conf import settings
+from django.core.asgi import get_asgi_application
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import override_settings
+from projects.models import Contributor, Issue, Project
+from rest_framework_simplejwt.tokens import AccessToken
+from users.hashing import hashing_pool
+from users.models import User
+
+
+async def call(application, method, path, body=None, token=None):
+    """Envoie une requête à l'application ASGI ; renvoie (statut, durée en secondes)."""
+    payload = json.dumps(body).encode() if body is not None else b""
+    headers = [
+        (b"host", b"localhost"),
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(payload)).encode()),
+    ]
+    if token:
+        headers.append((b"authorization", f"Bearer {token}".encode()))
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": method, "scheme": "http",
+        "path": path, "raw_path": path.encode(), "query_string": b"", "root_path": "", "headers": headers,
+        "client": ("127.0.0.1", 0), "server": ("localhost", 80),
+    }  # fmt: skip
+    sent = False
+    result = {}
+
+    async def receive():
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": payload, "more_body": False}
+        await asyncio.Event().wait()
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            result["status"] = message["status"]
+
+    start = time.perf_counter()
+    await application(scope, receive, send)
+    return result["status"], time.perf_counter() - start
+
+
+class Command(BaseCommand):
+    """Mesure, sous ASGI, la latence des lectures d'issues pendant une rafale de connexions,
+    avec les vues d'authentification exécutées comme les autres vues synchrones (PASSWORD_HASHING_WORKERS=0)
+    puis dans le pool borné de users.hashing. Travaille sur une base de test temporaire.
+    """
+
+    help = "Compare la latence des lectures pendant une rafale de connexions, avec et sans pool de hachage"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--logins", type=int, default=24, help="connexions simultanées de la rafale")
+        parser.add_argument(
+            "--workers", type=int, default=max((os.cpu_count() or 2) // 2, 1), help="threads du pool de hachage"
+        )
+
+    def handle(self, *args, **options):
+        test_db = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        # sans limitation de débit : la rafale ne doit être freinée que par le hachage
+        rest_framework = {**settings.REST_FRAMEWORK, "DEFAULT_THROTTLE_CLASSES": []}
+        try:
+            user = User.objects.create_user(email="bench@softdesk.fr", password="bench-password", age=30)
+            project = Project.objects.create(author=user, name="bench", description="bench")
+            Contributor.objects.create(user=user, project=project, author=True)
+            Issue.objects.bulk_create(
+                [Issue(project=project, author=user, attribution=user, name=f"issue {i}") for i in range(50)]
+            )
+            token = str(AccessToken.for_user(user))
+            path = f"/projects/{project.id}/issues/"
+            application = get_asgi_application()
+
+            for label, workers in (("sans pool", 0), (f"pool ({options['workers']} threads)", options["workers"])):
+                with override_settings(PASSWORD_HASHING_WORKERS=workers, REST_FRAMEWORK=rest_framework):
+                    hashing_pool.reset_stats()
+                    reads, logins = asyncio.run(self.burst(application, path, token, options["logins"]))
+                read_times = sorted(duration for _, duration in reads)
+                statuses = [status for status, _ in logins]
+                self.stdout.write(
+                    f"{label:<18} lectures: médiane={statistics.median(read_times) * 1000:7.1f} ms "
+                    f"max={read_times[-1] * 1000:7.1f} ms ({len(read_times)})  |  "
+                    f"connexions: 200={statuses.count(200)} 429={statuses.count(429)} "
+                    f"durée totale={max(duration for _, duration in logins) * 1000:7.1f} ms"
+                )
+                for endpoint, stats in hashing_pool.stats().items():
+                    self.stdout.write(
+                        f"{'':<18} {endpoint}: attente moyenne={stats['queue_ms_avg']:7.1f} ms "
+                        f"max={stats['queue_ms_max']:7.1f} ms, exécution moyenne={stats['run_ms_avg']:7.1f} ms"
+                    )
+        finally:
+            connection.creation.destroy_test_db(test_db, verbosity=0)
+
+    async def burst(self, application, path, token, count):
+        """Lance `count` connexions simultanées et enchaîne des lectures tant qu'elles ne sont pas terminées."""
+        body = {"email": "bench@softdesk.fr", "password": "bench-password"}
+        logins = asyncio.gather(*(call(application, "POST", "/users/login/", body) for _ in range(count)))
+        await asyncio.sleep(0)
+        reads = []
+        while not logins.done() or not reads:
+            reads.append(await call(application, "GET", path, token=token))
+        return reads, await logins
@@ -0,0 +1,66 @@
+import time
+import uuid
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+from users.models import RevokedToken, User
+from users.revocation import revocation_store
+from users.serializers import CustomTokenRefreshSerializer
+from users.tokens import RevocableRefreshToken
+
+
+class Command(BaseCommand):
+    """Mesure la latence d'un renouvellement de token (rotation + révocation)
+    en fonction du nombre de tokens révoqués déjà présents en base.
+    Travaille sur une base de test temporaire.
+    """
+
+    help = "Mesure la latence du renouvellement de token JWT selon le volume de tokens historiques"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", type=int, nargs="+", default=[0, 10000, 100000, 500000])
+        parser.add_argument("--refreshes", type=int, default=500, help="renouvellements mesurés par palier")
+
+    def handle(self, *args, **options):
+        test_db = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            user = User.objects.create_user(email="bench@softdesk.fr", password="bench", age=30)
+            refresh = str(RevocableRefreshToken.for_user(user))
+            seeded = 0
+            for size in options["sizes"]:
+                seeded = self.seed(seeded, size)
+                timings = []
+                for _ in range(options["refreshes"]):
+                    start = time.perf_counter()
+                    serializer = CustomTokenRefreshSerializer(data={"refresh": refresh})
+                    serializer.is_valid(raise_exception=True)
+                    timings.append(time.perf_counter() - start)
+                    refresh = serializer.validated_data["refresh"]
+                timings.sort()
+                self.stdout.write(
+                    f"historique={size:>8}  lignes en base={RevokedToken.objects.count():>8}  "
+                    f"p50={timings[len(timings) // 2] * 1000:.3f} ms  "
+                    f"p99={timings[int(len(timings) * 0.99)] * 1000:.3f} ms"
+                )
+        finally:
+            connection.creation.destroy_test_db(test_db, verbosity=0)
+
+    def seed(self, seeded, size):
+        """Ajoute des tokens historiques jusqu'à `size` : moitié expirés (à purger), moitié encore valides."""
+        now = timezone.now()
+        lifetime = api_settings.REFRESH_TOKEN_LIFETIME
+        rows = [
+            RevokedToken(
+                jti=uuid.uuid4().hex,
+                expires_at=now - timedelta(minutes=i % 60 + 1) if i % 2 else now + lifetime,
+            )
+            for i in range(seeded, size)
+        ]
+        RevokedToken.objects.bulk_create(rows, batch_size=5000)
+        # force la prise en compte des nouvelles lignes par le filtre
+        revocation_store._built_at = float("-inf")
+        revocation_store._last_sync = float("-inf")
+        return max(seeded, size)
@@ -0,0 +1,54 @@
+from datetime import datetime, timezone as dt_timezone
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from users.models import RevokedToken
+
+# tables laissées en base par l'ancienne app rest_framework_simplejwt.token_blacklist
+OUTSTANDING_TABLE = "token_blacklist_outstandingtoken"
+BLACKLISTED_TABLE = "token_blacklist_blacklistedtoken"
+
+
+def to_aware_datetime(value):
+    # SQLite renvoie les dates brutes sous forme de texte, en UTC
+    if isinstance(value, str):
+        value = parse_datetime(value)
+    if isinstance(value, datetime) and timezone.is_naive(value):
+        value = timezone.make_aware(value, dt_timezone.utc)
+    return value
+
+
+class Command(BaseCommand):
+    """Commande à lancer une fois lors de la mise à jour : recopie dans RevokedToken les refresh tokens
+    encore valides révoqués par l'ancienne app token_blacklist, pour qu'ils restent refusés.
+    Sans effet si les tables token_blacklist n'existent pas ; peut être relancée sans risque.
+    """
+
+    help = "Recopie les refresh tokens non expirés de token_blacklist dans le registre de révocation (RevokedToken)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000, help="nombre de lignes insérées par requête")
+
+    def handle(self, *args, **options):
+        tables = set(connection.introspection.table_names())
+        if not {OUTSTANDING_TABLE, BLACKLISTED_TABLE} <= tables:
+            self.stdout.write("Aucune table token_blacklist en base : rien à importer")
+            return
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT o.jti, o.expires_at FROM {BLACKLISTED_TABLE} b "
+                f"JOIN {OUTSTANDING_TABLE} o ON o.id = b.token_id WHERE o.expires_at > %s",
+                [connection.ops.adapt_datetimefield_value(timezone.now())],
+            )
+            rows = cursor.fetchall()
+
+        # un jti déjà présent (import relancé, token déjà révoqué à nouveau) est ignoré
+        RevokedToken.objects.bulk_create(
+            [RevokedToken(jti=jti, expires_at=to_aware_datetime(expires_at)) for jti, expires_at in rows],
+            batch_size=options["batch_size"],
+            ignore_conflicts=True,
+        )
+        self.stdout.write(f"{len(rows)} token(s) révoqué(s) importé(s)")
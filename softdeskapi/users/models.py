@@ -45,6 +45,8 @@ class User(AbstractBaseUser, PermissionsMixin):
     can_be_contacted = models.BooleanField(default=True)
     can_data_be_shared = models.BooleanField(default=False)
     date_joined = models.DateTimeField(default=timezone.now)
+    # incrémenté à chaque retrait d'un projet : invalide la liste de projets embarquée dans les tokens d'accès
+    membership_version = models.PositiveIntegerField(default=0)
     # définition d'un manager personnalisé pour le modèle User
     objects = UserManager()
     USERNAME_FIELD = "email"
@@ -53,3 +55,12 @@ class User(AbstractBaseUser, PermissionsMixin):
     def save(self, *args, **kwargs):
         """Enregistre l'utilisateur dans la base de données."""
         super().save(*args, **kwargs)
+
+
+class RevokedToken(models.Model):
+    """modèle pour représenter un refresh token révoqué (jti, expires_at).
+    Une ligne n'a plus d'utilité une fois le token expiré : elle est alors purgée.
+    """
+
+    jti = models.CharField(max_length=255, unique=True)
+    expires_at = models.DateTimeField(db_index=True)
@@ -0,0 +1,162 @@
+import hashlib
+import math
+import threading
+import time
+
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+
+from .models import RevokedToken
+
+
+class BloomFilter:
+    """Filtre de Bloom : ensemble probabiliste sans faux négatif.
+    `key in filtre` est faux => la clé n'a jamais été ajoutée (aucune requête en base nécessaire).
+    """
+
+    def __init__(self, capacity, error_rate=0.001):
+        self.capacity = max(capacity, 1)
+        # taille optimale du tableau de bits et nombre de fonctions de hachage pour le taux d'erreur visé
+        self.size = max(int(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)), 8)
+        self.hash_count = max(int(round(self.size / self.capacity * math.log(2))), 1)
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key):
+        # double hachage : k positions dérivées de deux entiers de 64 bits
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, key):
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class TokenRevocationStore:
+    """Registre des refresh tokens révoqués, de taille bornée.
+
+    - chaque ligne expire avec son token (au plus REFRESH_TOKEN_LIFETIME) et est purgée par petits lots ;
+    - un filtre de Bloom en mémoire évite la requête en base pour un token jamais révoqué (cas courant) ;
+    - la contrainte d'unicité sur `jti` garantit qu'un token ne peut être révoqué (donc utilisé
+      pour une rotation) qu'une seule fois, même si le filtre d'un autre processus n'est pas à jour.
+    """
+
+    # intervalle (en secondes) entre deux synchronisations incrémentales du filtre avec la base
+    sync_interval = 1.0
+    # une purge des lignes expirées toutes les `prune_every` révocations, par lots de `prune_batch` lignes
+    prune_every = 16
+    prune_batch = 500
+    # capacité initiale du filtre (doublée à la reconstruction tant qu'elle est inférieure à 2x le nombre de tokens)
+    initial_capacity = 10000
+    # lignes lues par requête lors de la reconstruction du filtre
+    rebuild_batch = 5000
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._filter = BloomFilter(self.initial_capacity)
+        self._last_id = 0
+        self._last_sync = 0.0
+        self._built_at = 0.0
+        self._rebuilding = False
+        self._revocations = 0
+        # révocations de ce processus déjà ajoutées au filtre mais pas encore lues par la synchronisation
+        # (id de ligne -> jti) : elles ne sont pas ajoutées une seconde fois au filtre
+        self._local = {}
+
+    def is_revoked(self, jti):
+        """Indique si le token `jti` a été révoqué. Ne consulte la base qu'en cas de réponse positive du filtre."""
+        self._sync()
+        if jti not in self._filter:
+            return False
+        # positif (vrai ou faux positif du filtre) : confirmation en base
+        return RevokedToken.objects.filter(jti=jti, expires_at__gt=timezone.now()).exists()
+
+    def revoke(self, jti, expires_at):
+        """Révoque le token `jti` jusqu'à `expires_at`.
+        Renvoie False si le token était déjà révoqué (réutilisation d'un refresh token).
+        """
+        try:
+            with transaction.atomic():
+                row = RevokedToken.objects.create(jti=jti, expires_at=expires_at)
+        except IntegrityError:
+            return False
+        with self._lock:
+            self._filter.add(jti)
+            self._local[row.id] = jti
+            self._revocations += 1
+            prune = self._revocations % self.prune_every == 0
+        if prune:
+            self.prune()
+        return True
+
+    def prune(self):
+        """Supprime un lot de lignes expirées (un seul DELETE borné)."""
+        expired = RevokedToken.objects.filter(expires_at__lte=timezone.now()).order_by("expires_at")
+        return RevokedToken.objects.filter(pk__in=expired.values("pk")[: self.prune_batch]).delete()[0]
+
+    def _sync(self):
+        """Ajoute au filtre les révocations faites par les autres processus depuis la dernière synchronisation.
+        Le filtre est reconstruit entièrement après une durée de vie de refresh token, pour oublier les
+        tokens expirés (un filtre de Bloom ne permet pas de supprimer une clé), et dès qu'il contient plus
+        de clés que sa capacité (son taux de faux positifs, donc de requêtes en base, augmenterait vite).
+        """
+        now = time.monotonic()
+        if now - self._last_sync < self.sync_interval:
+            return
+        with self._lock:
+            if now - self._last_sync < self.sync_interval:
+                return
+            self._last_sync = now
+            expired = now - self._built_at >= api_settings.REFRESH_TOKEN_LIFETIME.total_seconds()
+            if self._rebuilding or not (expired or self._filter.count > self._filter.capacity):
+                live = RevokedToken.objects.filter(expires_at__gt=timezone.now(), id__gt=self._last_id)
+                for row_id, jti in live.values_list("id", "jti"):
+                    if self._local.pop(row_id, None) is None:
+                        self._filter.add(jti)
+                    self._last_id = max(self._last_id, row_id)
+                # révocations locales expirées avant d'avoir été lues : elles ne le seront plus
+                self._local = {row_id: jti for row_id, jti in self._local.items() if row_id > self._last_id}
+                return
+            self._rebuilding = True
+        try:
+            self._rebuild(now)
+        finally:
+            self._rebuilding = False
+
+    def _rebuild(self, started):
+        """Reconstruit le filtre par lots de `rebuild_batch` lignes, sans tenir le verrou : les autres requêtes
+        continuent d'utiliser (et de synchroniser) l'ancien filtre jusqu'au remplacement.
+        """
+        live = RevokedToken.objects.filter(expires_at__gt=timezone.now())
+        capacity = self._filter.capacity
+        total = live.count()
+        while capacity < 2 * total:
+            capacity *= 2
+        bloom = BloomFilter(capacity)
+        last_id = 0
+        while True:
+            rows = list(live.filter(id__gt=last_id).order_by("id").values_list("id", "jti")[: self.rebuild_batch])
+            for last_id, jti in rows:
+                bloom.add(jti)
+            if len(rows) < self.rebuild_batch:
+                break
+        with self._lock:
+            # révocations locales faites pendant la lecture : ajoutées maintenant, ignorées à la prochaine
+            # synchronisation (qui reprend après `last_id`)
+            self._local = {row_id: jti for row_id, jti in self._local.items() if row_id > last_id}
+            for jti in self._local.values():
+                bloom.add(jti)
+            self._filter = bloom
+            self._last_id = last_id
+            self._built_at = started
+
+
+# registre partagé par toutes les requêtes du processus
+revocation_store = TokenRevocationStore()
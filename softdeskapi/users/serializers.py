@@ -1,8 +1,10 @@
 from projects.models import Project
 from rest_framework import serializers
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
 
 from .models import User
+from .tokens import RevocableRefreshToken
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -66,6 +68,8 @@ class UserListSerializer(serializers.ModelSerializer):
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     """gérer la validation et la génération des tokens JWT"""
 
+    token_class = RevocableRefreshToken
+
     def validate(self, attrs):
         try:
             # Rechercher l'utilisateur via l'email fourni
@@ -74,16 +78,22 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
             # Erreur générique pour des raisons de sécurité
             raise serializers.ValidationError("Identifiants incorrects")
 
-        # vérification du mot de passe
-        if not user.check_password(attrs["password"]):
+        # vérification du mot de passe (authenticate) et génération des tokens via la méthode parent :
+        # un seul hachage du mot de passe par connexion
+        try:
+            data = super().validate(attrs)
+        except AuthenticationFailed:
             raise serializers.ValidationError("Identifiants incorrects")
 
-        # Génération des tokens via la méthode parent
-        data = super().validate(attrs)
-
         # Ajout des détails utilisateur dans la réponse
         data["user_details"] = {
             "username": user.username,
             "email": user.email,
         }
         return data
+
+
+class CustomTokenRefreshSerializer(TokenRefreshSerializer):
+    """gérer le renouvellement des tokens JWT avec révocation du refresh token après rotation"""
+
+    token_class = RevocableRefreshToken
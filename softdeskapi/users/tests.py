@@ -1,3 +1,79 @@
-# from django.test import TestCase
+from datetime import timedelta
 
-# Create your tests here.
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from .models import RevokedToken, User
+from .revocation import TokenRevocationStore, revocation_store
+from .tokens import RevocableRefreshToken
+
+
+class TokenRefreshTests(TestCase):
+    """Rotation des refresh tokens : un refresh token déjà utilisé est refusé."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email="refresh@softdesk.fr", password="pw12345!ab", age=30)
+        self.client = APIClient()
+
+    def test_rotated_refresh_token_is_rejected_on_reuse(self):
+        refresh = str(RevocableRefreshToken.for_user(self.user))
+
+        response = self.client.post("/users/token/refresh/", {"refresh": refresh}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response.data["refresh"], refresh)
+
+        response = self.client.post("/users/token/refresh/", {"refresh": refresh}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_new_refresh_token_is_accepted(self):
+        refresh = str(RevocableRefreshToken.for_user(self.user))
+        rotated = self.client.post("/users/token/refresh/", {"refresh": refresh}, format="json").data["refresh"]
+
+        response = self.client.post("/users/token/refresh/", {"refresh": rotated}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class TokenRevocationStoreTests(TestCase):
+    """Registre des tokens révoqués : révocation unique, synchronisation du filtre et purge des lignes expirées."""
+
+    def test_revoke_twice_returns_false(self):
+        expires_at = timezone.now() + timedelta(hours=1)
+        self.assertTrue(revocation_store.revoke("jti-twice", expires_at))
+        self.assertFalse(revocation_store.revoke("jti-twice", expires_at))
+        self.assertTrue(revocation_store.is_revoked("jti-twice"))
+
+    def test_expired_token_is_no_longer_revoked(self):
+        # présent dans le filtre et en base, mais expiré
+        revocation_store.revoke("jti-expired", timezone.now() - timedelta(minutes=1))
+        self.assertFalse(revocation_store.is_revoked("jti-expired"))
+
+    def test_prune_deletes_only_expired_rows(self):
+        now = timezone.now()
+        RevokedToken.objects.bulk_create(
+            [RevokedToken(jti=f"jti-old-{i}", expires_at=now - timedelta(hours=1)) for i in range(3)]
+            + [RevokedToken(jti="jti-live", expires_at=now + timedelta(hours=1))]
+        )
+
+        self.assertEqual(revocation_store.prune(), 3)
+        self.assertEqual(list(RevokedToken.objects.values_list("jti", flat=True)), ["jti-live"])
+
+    def test_local_revocation_is_counted_once_after_sync(self):
+        store = TokenRevocationStore()
+        store.is_revoked("jti-unknown")
+        store.revoke("jti-local", timezone.now() + timedelta(hours=1))
+
+        store._last_sync = float("-inf")
+        self.assertTrue(store.is_revoked("jti-local"))
+        self.assertEqual(store._filter.count, 1)
+
+    def test_rebuild_reads_rows_in_batches(self):
+        expires_at = timezone.now() + timedelta(hours=1)
+        RevokedToken.objects.bulk_create([RevokedToken(jti=f"jti-{i}", expires_at=expires_at) for i in range(5)])
+        store = TokenRevocationStore()
+        store.rebuild_batch = 2
+
+        self.assertTrue(all(store.is_revoked(f"jti-{i}") for i in range(5)))
+        self.assertEqual(store._filter.count, 5)
+        self.assertEqual(store._last_id, RevokedToken.objects.order_by("-id").values_list("id", flat=True)[0])
@@ -0,0 +1,57 @@
+from django.conf import settings
+from django.db.models import F
+from projects.models import Contributor
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+from .models import User
+from .revocation import revocation_store
+
+# claims d'appartenance aux projets embarqués dans le token d'accès (voir projects.permissions.IsContributor)
+PROJECTS_CLAIM = "projects"
+MEMBERSHIP_VERSION_CLAIM = "membership_version"
+
+
+class RevocableRefreshToken(RefreshToken):
+    """Refresh token dont la révocation (après rotation) est enregistrée dans le registre à durée de vie bornée
+    `revocation_store`, à la place des tables OutstandingToken/BlacklistedToken jamais purgées.
+    """
+
+    def verify(self, *args, **kwargs):
+        # vérifie d'abord signature et expiration (sans requête), puis la révocation
+        super().verify(*args, **kwargs)
+        if revocation_store.is_revoked(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError("Ce token a été révoqué")
+
+    def blacklist(self):
+        """Révoque ce token jusqu'à son expiration. Appelée par TokenRefreshSerializer après rotation."""
+        jti = self.payload[api_settings.JTI_CLAIM]
+        if not revocation_store.revoke(jti, datetime_from_epoch(self.payload["exp"])):
+            # le token vient d'être utilisé pour une autre rotation (requête concurrente ou rejouée)
+            raise TokenError("Ce token a été révoqué")
+
+    @property
+    def access_token(self):
+        """Token d'accès avec, si TOKEN_MEMBERSHIP_CLAIMS est actif, les id des projets de l'utilisateur
+        et sa version d'appartenance, recalculés à chaque connexion et à chaque renouvellement.
+        """
+        access = super().access_token
+        if getattr(settings, "TOKEN_MEMBERSHIP_CLAIMS", False):
+            user_id = self.payload.get(api_settings.USER_ID_CLAIM)
+            version = User.objects.filter(id=user_id).values_list("membership_version", flat=True).first()
+            project_ids = sorted(Contributor.objects.filter(user_id=user_id).values_list("project_id", flat=True))
+            if version is not None and len(project_ids) <= settings.TOKEN_MEMBERSHIP_CLAIMS_MAX_PROJECTS:
+                access[PROJECTS_CLAIM] = project_ids
+                access[MEMBERSHIP_VERSION_CLAIM] = version
+        return access
+
+
+def invalidate_membership_claims(user_ids):
+    """Invalide les projets embarqués dans les tokens d'accès des utilisateurs `user_ids` (retirés d'un projet),
+    en un seul UPDATE. Sans effet si TOKEN_MEMBERSHIP_CLAIMS est désactivé : les tokens n'embarquent alors
+    aucun projet.
+    """
+    if user_ids and getattr(settings, "TOKEN_MEMBERSHIP_CLAIMS", False):
+        User.objects.filter(id__in=user_ids).update(membership_version=F("membership_version") + 1)
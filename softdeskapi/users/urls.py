@@ -1,7 +1,7 @@
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
-from .views import CreateUserAPIView, CustomTokenObtainPairView, UserViewSet
+from .views import CreateUserAPIView, CustomTokenObtainPairView, CustomTokenRefreshView, UserViewSet
 
 # Initialise DefaultRouter pour les vues basées sur UserViewSet
 router = DefaultRouter()
@@ -12,6 +12,8 @@ urlpatterns = [
     path("register/", CreateUserAPIView.as_view(), name="register"),
     # authentification JWT
     path("login/", CustomTokenObtainPairView.as_view(), name="token_obtain_pair"),
+    # renouvellement du token d'accès (rotation du refresh token)
+    path("token/refresh/", CustomTokenRefreshView.as_view(), name="token_refresh"),
     # Inclut les routes générées par DefaultRouter
     path("", include(router.urls)),
 ]
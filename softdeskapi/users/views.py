@@ -2,20 +2,33 @@ from django.shortcuts import get_object_or_404
 from projects.models import Project
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework_simplejwt.views import TokenObtainPairView
+from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
+from softdeskapi.streaming import StreamingListMixin, StreamingPaginationMixin
 
+from .hashing import OffThreadHashingMixin
 from .models import User
-from .serializers import CustomTokenObtainPairSerializer, UserListSerializer, UserSerializer
+from .serializers import (
+    CustomTokenObtainPairSerializer,
+    CustomTokenRefreshSerializer,
+    UserListSerializer,
+    UserSerializer,
+)
 
 
-class UserViewSet(viewsets.ModelViewSet):
+class UserPagination(StreamingPaginationMixin, PageNumberPagination):
+    """Pagination de la liste des utilisateurs (`?page_size=` jusqu'à 1000), envoyée en flux."""
+
+
+class UserViewSet(StreamingListMixin, viewsets.ModelViewSet):
     """Vue pour gérer les opérations CRUD sur le modèle User (pour le RGPD...)."""
 
     queryset = User.objects.all().order_by("id")  # ordonner les users par id pour une pagination cohérente
     permission_classes = [IsAuthenticated]
+    pagination_class = UserPagination
 
     def get_serializer_class(self):
         # Utilise `UserListSerializer` pour les requêtes en lecture seule (GET)
@@ -93,8 +106,11 @@ class UserViewSet(viewsets.ModelViewSet):
         )
 
 
-class CreateUserAPIView(APIView):
-    """Cette classe gère la création d'un utilisateur via l'API"""
+class CreateUserAPIView(OffThreadHashingMixin, APIView):
+    """Cette classe gère la création d'un utilisateur via l'API
+    (exécutée dans le pool de hachage des mots de passe, voir users.hashing)"""
+
+    hashing_endpoint = "register"
 
     # Permission qui permet à tout utilisateur (authentifié ou non) d'accéder à cette URL
     permission_classes = (AllowAny,)
@@ -113,15 +129,17 @@ class CreateUserAPIView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
-class CustomTokenObtainPairView(TokenObtainPairView):
+class CustomTokenObtainPairView(OffThreadHashingMixin, TokenObtainPairView):
     """sous-classe de TokenObtainPairView (rest_framework_simplejwt) qui personnalise
     la réponse lors de l'obtention des tokens JWT d'accès et de rafraîchissement
+    (exécutée dans le pool de hachage des mots de passe, voir users.hashing)
     Args:
         TokenObtainPairView (parent class):
         permettre aux utilisateurs d'obtenir des tokens JWT (d'accès et de rafraîchissement)
     """
 
     serializer_class = CustomTokenObtainPairSerializer
+    hashing_endpoint = "login"
 
     # Reçoit une requête POST avec les informations de connexion (comme l'email et le mot de passe)
     def post(self, request, *args, **kwargs):
@@ -145,3 +163,11 @@ class CustomTokenObtainPairView(TokenObtainPairView):
             },
             status=status.HTTP_200_OK,
         )
+
+
+class CustomTokenRefreshView(TokenRefreshView):
+    """sous-classe de TokenRefreshView (rest_framework_simplejwt) : renvoie un nouveau token d'accès
+    et un nouveau refresh token, l'ancien étant révoqué jusqu'à son expiration
+    """
+
+    serializer_class = CustomTokenRefreshSerializer